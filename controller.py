@@ -9,7 +9,7 @@ Author: Luke Mileski (lmileski@sandiego.edu)
 from tkinter import Event
 from typing import Callable
 from model import BoardModel, CurrentSettings, SquareModel
-from view import View
+from view import View, board_size_values, CHECKER_COLORS, CHECKER_DISPLAY
 import model_helpers
 
 
@@ -48,9 +48,10 @@ class Controller:
         # assigning board data to the View's board
         setattr(self.view.board_frame, 'board_data', self.model.board)
         # assigning stats to the scoreboard
-        setattr(self.view.right_menu_frame.scoreboard, 'total_populations', self.model.total_populations)
-        setattr(self.view.right_menu_frame.scoreboard, 'average_levels', self.model.average_levels)
-        setattr(self.view.right_menu_frame.scoreboard, 'average_hunger_level', self.model.average_hunger_level)
+        scoreboard = self.view.right_menu_frame.get_scoreboard()
+        setattr(scoreboard, 'total_populations', self.model.total_populations)
+        setattr(scoreboard, 'average_levels', self.model.average_levels)
+        setattr(scoreboard, 'average_hunger_level', self.model.average_hunger_level)
         # assigning each squares model data to its respective square view
         for x, column in enumerate(self.model.board):
             for y, square_model in enumerate(column):
@@ -59,6 +60,9 @@ class Controller:
                 # assigns the square view their animal view objects
                 if start_of_round:
                     square_view.create_animals()
+        # the pieces of animals that didn't survive the last round are only kept until the next round starts
+        if start_of_round:
+            self.view.board_frame.prune_pawn_pool()
 
     def set_widget_commands(self) -> None:
         """
@@ -86,7 +90,7 @@ class Controller:
         widget_command_manager.export_data_to_excel_button_command
 
         self.view.left_menu_frame.game_controls.number_of_rounds_scale['command'] = \
-        widget_command_manager.number_of_rounds_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.number_of_rounds_scale_command)
 
         self.view.left_menu_frame.configurations.restore_default_settings_button['command'] = \
         widget_command_manager.restore_settings_button_command
@@ -104,25 +108,25 @@ class Controller:
         widget_command_manager.customize_starting_animals_checkbox_command
 
         self.view.left_menu_frame.configurations.custom_predator_level_scale['command'] = \
-        widget_command_manager.predator_level_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.predator_level_scale_command)
 
         self.view.left_menu_frame.configurations.custom_predator_population_scale['command'] = \
-        widget_command_manager.predator_population_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.predator_population_scale_command)
 
         self.view.left_menu_frame.configurations.custom_predator_starvation_scale['command'] = \
-        widget_command_manager.predator_starvation_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.predator_starvation_scale_command)
 
         self.view.left_menu_frame.configurations.custom_prey_level_scale['command'] = \
-        widget_command_manager.prey_level_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.prey_level_scale_command)
 
         self.view.left_menu_frame.configurations.custom_prey_population_scale['command'] = \
-        widget_command_manager.prey_population_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.prey_population_scale_command)
 
         self.view.left_menu_frame.configurations.automatic_round_start_checkbutton['command'] = \
         widget_command_manager.automatic_round_start_checkbox_command
 
         self.view.left_menu_frame.configurations.custom_round_delay_scale['command'] = \
-        widget_command_manager.round_delay_scale_command
+        widget_command_manager.throttle_scale_command(widget_command_manager.round_delay_scale_command)
 
 
 class WidgetCommands:
@@ -131,6 +135,9 @@ class WidgetCommands:
     """
 
     next_game_command: Callable # required to keep track of stage in mainloop for the autofinish game button
+    pending_scale_tasks: dict[str, str] # scale command name -> its scheduled task
+    pending_scale_values: dict[str, str] # scale command name -> the scale's latest value not yet passed to it
+    scale_commands: dict[str, Callable[[str], None]] # scale command name -> the unthrottled command
 
     def __init__(self, controller: Controller):
         """
@@ -141,14 +148,58 @@ class WidgetCommands:
         self.view = self.controller.view
         self.game_controls_frame = self.view.left_menu_frame.game_controls
         self.configurations_frame = self.view.left_menu_frame.configurations
-        self.scoreboard_frame = self.view.right_menu_frame.scoreboard
         self.settings = self.controller.settings
         self.default_settings = CurrentSettings.default_settings()
+        self.pending_scale_tasks = {}
+        self.pending_scale_values = {}
+        self.scale_commands = {}
+
+    def throttle_scale_command(self, scale_command: Callable[[str], None], interval: int = 33) -> Callable[[str], None]:
+        """
+        Wraps a scale command so it's called with the scale's latest value at most once per interval
+        Dragging a scale calls its command for every pixel moved - the markers still follow the
+        scale while it's dragged, but at most ~30 times a second
+
+        Parameters:
+            - scale_command (Callable): the scale's command taking the scale's value
+            - interval (int): minimum milliseconds between calls of the command
+        """
+        command_name = scale_command.__name__
+        self.scale_commands[command_name] = scale_command
+
+        def call_scale_command() -> None:
+            del self.pending_scale_tasks[command_name]
+            scale_command(self.pending_scale_values.pop(command_name))
+
+        def throttled_scale_command(value: str) -> None:
+            self.pending_scale_values[command_name] = value
+            # the already scheduled call will use this newer value
+            if command_name not in self.pending_scale_tasks:
+                self.pending_scale_tasks[command_name] = self.view.after(interval, call_scale_command)
+
+        return throttled_scale_command
+
+    def flush_scale_commands(self, apply_values: bool = True) -> None:
+        """
+        Cancels the scale commands still waiting on their throttle interval so none of them
+        change the settings or scoreboard once a game has started
+
+        Parameters:
+            - apply_values (bool): True if the commands are called right away with the scales' latest values
+        """
+        for command_name, task in self.pending_scale_tasks.items():
+            self.view.after_cancel(task)
+            value = self.pending_scale_values.pop(command_name)
+            if apply_values:
+                self.scale_commands[command_name](value)
+        self.pending_scale_tasks.clear()
     
     def start_game_button_command(self) -> None:
         """
         Handles events when the user clicks the Start Game button
         """
+        # the game starts with the scales' latest values
+        self.flush_scale_commands()
         # setting up the model upon its initialization depending on the user's configurations
         self.controller.model = BoardModel(self.settings)
         self.model = self.controller.model
@@ -189,7 +240,7 @@ class WidgetCommands:
                 self.current_gui_time, lambda: self.view.board_frame.display_round_label(self.model.current_round))
             self.view.board_frame.scheduled_tasks.append(display_round_label_task)
             update_round_label_task = self.view.after(
-                    self.current_gui_time, lambda: self.view.right_menu_frame.scoreboard.round_label.configure(text=f'Round {self.model.current_round}'))
+                    self.current_gui_time, lambda: self.view.right_menu_frame.get_scoreboard().set_round(self.model.current_round))
             self.view.board_frame.scheduled_tasks.append(update_round_label_task)
             
             self.current_gui_time += self.settings.delay_between_board_labels
@@ -208,10 +259,11 @@ class WidgetCommands:
         # displaying the 'start round' button if the user has pause between rounds on
         if self.settings.pause_between_rounds == 'on': # autofinish is never on when pause between rounds is on
             # for autofinish game button
-            self.view.after(self.current_gui_time, lambda command=self.start_round_button_command: setattr(self, 'next_game_command', command))
+            set_next_game_command_task = self.view.after(self.current_gui_time, lambda command=self.start_round_button_command: setattr(self, 'next_game_command', command))
+            self.view.board_frame.scheduled_tasks.append(set_next_game_command_task)
             # displaying the round start button
             display_start_round_button_task = self.view.after(self.current_gui_time, lambda:
-                self.view.left_menu_frame.game_controls.start_round_button.grid(**self.view.left_menu_frame.game_controls.start_round_button_grid_info))
+                self.game_controls_frame.show_widgets(self.game_controls_frame.start_round_button))
             self.view.board_frame.scheduled_tasks.append(display_start_round_button_task)
             # resetting gui time
             self.current_gui_time = 0
@@ -222,7 +274,8 @@ class WidgetCommands:
                 start_round_button_command_task = self.view.after(self.current_gui_time, self.start_round_button_command)
                 self.view.board_frame.scheduled_tasks.append(start_round_button_command_task)
                 # for autofinish game button
-                self.view.after(self.current_gui_time, lambda command=self.finish_round_button_command: setattr(self, 'next_game_command', command))
+                set_next_game_command_task = self.view.after(self.current_gui_time, lambda command=self.finish_round_button_command: setattr(self, 'next_game_command', command))
+                self.view.board_frame.scheduled_tasks.append(set_next_game_command_task)
                 self.current_gui_time = 500 # resetting gui time + buffer
             else:
                 self.start_round_button_command()
@@ -253,7 +306,7 @@ class WidgetCommands:
             # adding to current gui time - multipying by the number of diagonal sections
             self.current_gui_time += self.settings.delay_between_square_results_labels*(2*self.settings.board_length-1)
             # updating the scoreboard
-            update_scoreboard_task = self.view.after(self.current_gui_time, self.view.right_menu_frame.scoreboard.update_scoreboard)
+            update_scoreboard_task = self.view.after(self.current_gui_time, self.view.right_menu_frame.get_scoreboard().update_scoreboard)
             self.view.board_frame.scheduled_tasks.append(update_scoreboard_task)
             # adding buffer
             buffer = int(self.model.total_populations[0] + self.model.total_populations[1]*25 + 1000)
@@ -267,10 +320,11 @@ class WidgetCommands:
         if self.settings.pause_between_rounds == 'on': # autofinish is never on when pause_between_rounds is on
             self.current_gui_time += 1000 # adding buffer
             display_finish_round_button_task = self.view.after(self.current_gui_time, lambda:
-                self.view.left_menu_frame.game_controls.finish_round_button.grid(**self.view.left_menu_frame.game_controls.finish_round_button_grid_info))
+                self.game_controls_frame.show_widgets(self.game_controls_frame.finish_round_button))
             self.view.board_frame.scheduled_tasks.append(display_finish_round_button_task)
             # for autofinish game button
-            self.view.after(self.current_gui_time, lambda command=self.finish_round_button_command: setattr(self, 'next_game_command', command))
+            set_next_game_command_task = self.view.after(self.current_gui_time, lambda command=self.finish_round_button_command: setattr(self, 'next_game_command', command))
+            self.view.board_frame.scheduled_tasks.append(set_next_game_command_task)
             self.current_gui_time = 0
         else:
             if self.settings.autofinish_game == 'off':
@@ -279,7 +333,8 @@ class WidgetCommands:
                 finish_round_button_command_task = self.view.after(self.current_gui_time, self.finish_round_button_command)
                 self.view.board_frame.scheduled_tasks.append(finish_round_button_command_task)
                 # for autofinish game button
-                self.view.after(self.current_gui_time, lambda command=self.scatter_pawns: setattr(self, 'next_game_command', command))
+                set_next_game_command_task = self.view.after(self.current_gui_time, lambda command=self.scatter_pawns: setattr(self, 'next_game_command', command))
+                self.view.board_frame.scheduled_tasks.append(set_next_game_command_task)
                 self.current_gui_time = 500
             else:
                 self.finish_round_button_command()
@@ -293,7 +348,7 @@ class WidgetCommands:
             finish_round_button_hide_task = self.view.after(self.current_gui_time, self.view.left_menu_frame.game_controls.finish_round_button.grid_forget)
             self.view.board_frame.scheduled_tasks.append(finish_round_button_hide_task)
             # uncoloring the scoreboard's marker colors
-            uncolor_scoreboard_text_task = self.view.after(self.current_gui_time, self.view.right_menu_frame.scoreboard.uncolor_scoreboard_text)
+            uncolor_scoreboard_text_task = self.view.after(self.current_gui_time, self.view.right_menu_frame.get_scoreboard().uncolor_scoreboard_text)
             self.view.board_frame.scheduled_tasks.append(uncolor_scoreboard_text_task)
             # displaying the collecting pawns label
             display_collecting_pawns_label_task = self.view.after(self.current_gui_time, self.view.board_frame.display_collecting_pawns_label)
@@ -332,22 +387,22 @@ class WidgetCommands:
                 )
                 self.view.board_frame.scheduled_tasks.append(configure_export_button_task)
 
-                display_export_button_task = self.view.after(self.current_gui_time, lambda: self.view.left_menu_frame.game_controls.export_data_button.grid(
-                    **self.view.left_menu_frame.game_controls.export_data_button_grid_info)
-                    )
+                display_export_button_task = self.view.after(self.current_gui_time, lambda:
+                    self.game_controls_frame.show_widgets(self.game_controls_frame.export_data_button))
                 self.view.board_frame.scheduled_tasks.append(display_export_button_task)
         else:
             # clearing the data from the model's previous squares and updating round number
             self.model.clear_board()
-            # clearing all old scheduled tasks and labels - already over and done
+            # clearing all old scheduled tasks - already over and done
             if self.settings.autofinish_game == 'off':
-                self.view.after(self.current_gui_time, self.view.board_frame.scheduled_tasks.clear)
-                self.view.after(self.current_gui_time, self.view.board_frame.scheduled_labels.clear)
+                clear_scheduled_tasks_task = self.view.after(self.current_gui_time, self.view.board_frame.scheduled_tasks.clear)
+                self.view.board_frame.scheduled_tasks.append(clear_scheduled_tasks_task)
                 # scheduling next round
                 scatter_pawns_task = self.view.after(self.current_gui_time, self.scatter_pawns)
                 self.view.board_frame.scheduled_tasks.append(scatter_pawns_task)
                 # for autofinish game button
-                self.view.after(self.current_gui_time, lambda command=self.start_round_button_command: setattr(self, 'next_game_command', command))
+                set_next_game_command_task = self.view.after(self.current_gui_time, lambda command=self.start_round_button_command: setattr(self, 'next_game_command', command))
+                self.view.board_frame.scheduled_tasks.append(set_next_game_command_task)
                 self.current_gui_time = 500
             else:
                 self.scatter_pawns()
@@ -363,7 +418,7 @@ class WidgetCommands:
         # cancelling upcoming visuals/labels
         self.cancel_all_tasks_and_visuals()
         # resetting the scoreboard
-        self.view.right_menu_frame.scoreboard.reset_scoreboard_text()
+        self.view.right_menu_frame.get_scoreboard().reset_scoreboard_text()
         # unlocking the user's configuration settings
         self.change_configuration_widget_states('normal')
         # only showing the start game button
@@ -391,9 +446,10 @@ class WidgetCommands:
         # displaying the game winner label
         self.view.board_frame.display_game_winner_label(self.model.game_winner, 'show')
         # updating then uncoloring the scoreboard text
-        self.view.right_menu_frame.scoreboard.update_scoreboard()
-        self.view.right_menu_frame.scoreboard.round_label.config(text=f'Round {self.settings.num_rounds}')
-        self.view.right_menu_frame.scoreboard.uncolor_scoreboard_text()
+        scoreboard = self.view.right_menu_frame.get_scoreboard()
+        scoreboard.update_scoreboard()
+        scoreboard.set_round(self.settings.num_rounds)
+        scoreboard.uncolor_scoreboard_text()
         # reconfiguring the user's settings to their original
         self.settings.update_settings(('change_of_rounds', 'pause_between_rounds', previous_pause_between_rounds))
         self.settings.update_settings(('change_of_rounds', 'autofinish_game', 'off'))
@@ -406,18 +462,17 @@ class WidgetCommands:
     
     def cancel_all_tasks_and_visuals(self) -> None:
         """
-        Cancels all the scheduled tasks and destroys all labels on the screen
+        Cancels all the scheduled tasks and clears all pawns, symbols, and labels from the board
         needed to immediately stop the visuals for the reset and autofinish game buttons
         """
+        # canceling any throttled scale commands - the scales are disabled during a game
+        self.flush_scale_commands(apply_values=False)
         # canceling all active visual tasks
         while self.view.board_frame.scheduled_tasks:
             task = self.view.board_frame.scheduled_tasks.pop()
             self.view.board_frame.after_cancel(task)
-        # removing any existent labels
-        for label in self.view.board_frame.scheduled_labels:
-            if label.winfo_exists():
-                label.destroy()
-        self.view.board_frame.scheduled_labels.clear()
+        # removing the pawns, symbols, and labels on the board
+        self.view.board_frame.clear_visuals()
 
     def change_configuration_widget_states(self, state: str) -> None:
         """
@@ -481,35 +536,20 @@ class WidgetCommands:
                 - 'reset' : hides and shows certain buttons when the 'reset game' button is pressed
                 - 'autofinish' : hides and shows certain buttons when the 'autofinish game' button is pressed
         """
+        game_controls = self.game_controls_frame
         if button_press == 'start':
-            self.game_controls_frame.start_game_button.grid_forget()
-            self.game_controls_frame.placeholder_label.grid_forget()
-
-            self.game_controls_frame.reset_game_button.grid(
-                **self.game_controls_frame.reset_game_button_grid_info)
-            self.game_controls_frame.autofinish_game_button.grid(
-                **self.game_controls_frame.autofinish_game_button_grid_info)
+            game_controls.hide_widgets(game_controls.start_game_button)
+            game_controls.show_widgets(game_controls.reset_game_button, game_controls.autofinish_game_button)
         
         elif button_press == 'reset':
-            self.game_controls_frame.start_game_button.grid(
-                **self.game_controls_frame.start_game_button_grid_info)
-            self.game_controls_frame.placeholder_label.grid(
-                **self.game_controls_frame.placeholder_label_grid_info)
-
-            self.game_controls_frame.reset_game_button.grid_forget()
-            self.game_controls_frame.autofinish_game_button.grid_forget()
-            self.game_controls_frame.start_round_button.grid_forget()
-            self.game_controls_frame.finish_round_button.grid_forget()
+            game_controls.show_widgets(game_controls.start_game_button)
+            game_controls.hide_widgets(game_controls.reset_game_button, game_controls.autofinish_game_button,
+                                       game_controls.start_round_button, game_controls.finish_round_button)
         
         elif button_press == 'autofinish':
-            self.game_controls_frame.export_data_button.grid(
-                **self.game_controls_frame.export_data_button_grid_info)
-            self.game_controls_frame.placeholder_label.grid(
-                **self.game_controls_frame.placeholder_label_grid_info)
-
-            self.game_controls_frame.autofinish_game_button.grid_forget()
-            self.game_controls_frame.start_round_button.grid_forget()
-            self.game_controls_frame.finish_round_button.grid_forget()
+            game_controls.show_widgets(game_controls.export_data_button)
+            game_controls.hide_widgets(game_controls.autofinish_game_button,
+                                       game_controls.start_round_button, game_controls.finish_round_button)
             
         else:
             raise ValueError("The button_press argument must either be 'start' or 'reset'")
@@ -522,8 +562,7 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('change_of_rounds', 'num_rounds', new_value))
 
-        num_rounds_marker = self.game_controls_frame.number_of_rounds_scale_marker
-        num_rounds_marker.configure(text=new_value)
+        self.game_controls_frame.number_of_rounds_value.set(str(new_value))
     
     def restore_settings_button_command(self) -> None:
         """
@@ -540,10 +579,10 @@ class WidgetCommands:
         self.customize_starting_animals_checkbox_command()
 
         # removing advisory label and lock on animal checkbox if board was 1x1
-        if self.configurations_frame.custom_animals_checkbutton.cget('state') == 'disabled':
+        if self.configurations_frame.custom_animals_checkbutton.instate(['disabled']):
             self.configurations_frame.custom_animals_checkbutton.configure(state='normal')
         # removing advisory label
-        self.view.left_menu_frame.board_size_advisory_label.pack_forget()
+        self.view.left_menu_frame.hide_board_size_advisory_label()
     
     def customize_board_checkbox_command(self) -> None:
         """
@@ -553,27 +592,10 @@ class WidgetCommands:
         box_checked = self.configurations_frame.custom_board_checkbox_value.get()
         if box_checked == 1: # true
             # showing widgets
-            self.configurations_frame.custom_board_size_label.grid(
-                **self.configurations_frame.custom_board_size_label_grid_info
-            )
-            self.configurations_frame.custom_board_size_box.grid(
-                **self.configurations_frame.custom_board_size_box_grid_info
-            )
-            self.configurations_frame.custom_checker_color_label.grid(
-                **self.configurations_frame.custom_checker_color_label_grid_info
-            )
-            self.configurations_frame.custom_checker_color_box.grid(
-                **self.configurations_frame.custom_checker_color_box_grid_info
-            )
+            self.configurations_frame.show_widgets(*self.configurations_frame.board_section)
         else:
             # hiding widgets
-            self.configurations_frame.custom_board_size_label.grid_forget()
-
-            self.configurations_frame.custom_board_size_box.grid_forget()
-
-            self.configurations_frame.custom_checker_color_label.grid_forget()
-
-            self.configurations_frame.custom_checker_color_box.grid_forget()
+            self.configurations_frame.hide_widgets(*self.configurations_frame.board_section)
 
             # updating settings with default board size and colors
             specific_color1 = self.default_settings['board']['checkered_color1']
@@ -584,14 +606,9 @@ class WidgetCommands:
             self.settings.update_settings(('board', 'checkered_color2', specific_color2))
 
             # updating views and scale set for all widgets
-            if specific_color1 == 'navajowhite4':
-                specific_color1 = 'brown' # not specific anymore
-            if specific_color2 == 'mint cream':
-                specific_color2 = 'white' # not specific anymore
-
-            self.configurations_frame.custom_board_size_box.set(f'{self.settings.board_length}x{self.settings.board_length}')
-            self.configurations_frame.custom_checker_color_box.set(
-                f'{(specific_color1).capitalize()} x {(specific_color2).capitalize()}')
+            self.configurations_frame.custom_board_size_box.set(
+                board_size_values(self.settings.max_board_length)[self.settings.board_length-1])
+            self.configurations_frame.custom_checker_color_box.set(CHECKER_DISPLAY[(specific_color1, specific_color2)])
 
             # redrawing board
             self.view.board_frame.draw_board()
@@ -603,21 +620,22 @@ class WidgetCommands:
         # grabbing the modified board size from the combobox of the event
         combobox = event.widget
         selection = combobox.get()
-        new_board_length = int(selection[0])
+        # the combobox's values go from '1x1' up to the max board size
+        new_board_length = board_size_values(self.settings.max_board_length).index(selection) + 1
 
         self.settings.update_settings(('board', 'board_length', new_board_length))
         self.view.board_frame.draw_board()
         # updating population scales/markers - population capacity depends on number of squares
-        max_pop_capacity = (self.settings.board_length**2) * 4
+        max_pop_capacity = self.settings.max_population
 
         self.configurations_frame.custom_predator_population_scale.configure(to=max_pop_capacity)
-        if int(self.configurations_frame.predator_population_scale_marker.cget('text')) > max_pop_capacity:
+        if self.settings.num_initial_predators > max_pop_capacity:
             self.predator_population_scale_command(str(max_pop_capacity))
         else:
             self.configurations_frame.custom_predator_population_scale.set(self.settings.num_initial_predators)
 
         self.configurations_frame.custom_prey_population_scale.configure(to=max_pop_capacity)
-        if int(self.configurations_frame.prey_population_scale_marker.cget('text')) > max_pop_capacity:
+        if self.settings.num_initial_prey > max_pop_capacity:
             self.prey_population_scale_command(str(max_pop_capacity))
         else:
             self.configurations_frame.custom_prey_population_scale.set(self.settings.num_initial_prey)
@@ -631,43 +649,22 @@ class WidgetCommands:
             # disabling the checkbox
             self.configurations_frame.custom_animals_checkbutton.configure(state='disabled')
             # adding advisory label
-            self.view.left_menu_frame.board_size_advisory_label.pack(
-                self.view.left_menu_frame.board_size_advisory_label_pack_info
-            )
+            self.view.left_menu_frame.show_board_size_advisory_label()
         else:
             # undisabling checkbox value if board length isn't 1x1
-            if self.configurations_frame.custom_animals_checkbutton.cget('state') == 'disabled':
+            if self.configurations_frame.custom_animals_checkbutton.instate(['disabled']):
                 self.configurations_frame.custom_animals_checkbutton.configure(state='normal')
             # removing advisory label
-            self.view.left_menu_frame.board_size_advisory_label.pack_forget()
+            self.view.left_menu_frame.hide_board_size_advisory_label()
 
     def board_colors_combobox_command(self, event: Event) -> None:
         """
         Handles events when the user selects an option from the board colors combobox
         """
-        # grabbing the modified board size from the combobox of the event
+        # grabbing the selected colors from the combobox of the event - finding their specific color names
         combobox = event.widget
-        selection = combobox.get()
-        x_index = selection.index('x')
-        checker_color1 = selection[:x_index-1].lower()
-        checker_color2 = selection[x_index+2:].lower()
-
-        # finding specific color names
-        if checker_color1 == 'brown':
-            checker_color1 = 'navajowhite4'
-        elif checker_color1 == 'gray':
-            checker_color1 = 'light slate gray'
-        elif checker_color1 == 'blue':
-            checker_color1 = 'sky blue'
-        else: # pink
-            checker_color1 = 'thistle'
-
-        # only checker color 2 option is white - this color is close enough
-        if checker_color2 == 'white':
-            checker_color2 = 'mint cream'
-        else: # pink
-            checker_color2 = 'thistle' 
-        
+        checker_color1, checker_color2 = CHECKER_COLORS[combobox.get()]
+
         self.settings.update_settings(('board', 'checkered_color1', checker_color1))
         self.settings.update_settings(('board', 'checkered_color2', checker_color2))
         # redrawing the board
@@ -683,29 +680,17 @@ class WidgetCommands:
             # showing widgets
             self.settings.update_settings(('change_of_rounds', 'pause_between_rounds', 'off'))
 
-            self.configurations_frame.round_delay_label.grid(
-                **self.configurations_frame.round_delay_label_grid_info
-            )
-            self.configurations_frame.custom_round_delay_scale.grid(
-                **self.configurations_frame.custom_round_delay_scale_grid_info
-            )
-            self.configurations_frame.custom_round_delay_scale_marker.grid(
-                **self.configurations_frame.custom_round_delay_scale_marker_grid_info
-            )
+            self.configurations_frame.show_widgets(*self.configurations_frame.round_delay_section)
         else: # false
             # hiding widgets
-            self.configurations_frame.round_delay_label.grid_forget()
-
-            self.configurations_frame.custom_round_delay_scale.grid_forget()
-
-            self.configurations_frame.custom_round_delay_scale_marker.grid_forget()
+            self.configurations_frame.hide_widgets(*self.configurations_frame.round_delay_section)
 
             # updating settings with default round delay
             self.settings.update_settings(('change_of_rounds', 'pause_between_rounds', 'on'))
             self.settings.update_settings(('change_of_rounds', 'delay_between_rounds',
                                            self.default_settings['change_of_rounds']['delay_between_rounds']))
             # updating scale views and markers to default
-            self.configurations_frame.custom_round_delay_scale_marker.configure(text=f'{self.settings.delay_between_rounds}s')
+            self.configurations_frame.custom_round_delay_scale_marker.set_text(f'{self.settings.delay_between_rounds}s')
             self.configurations_frame.custom_round_delay_scale.set(self.settings.delay_between_rounds)
 
     def round_delay_scale_command(self, value: str) -> None:
@@ -717,8 +702,7 @@ class WidgetCommands:
         self.settings.update_settings(('change_of_rounds',
                                        'delay_between_rounds', new_value))
     
-        round_delay_marker = self.configurations_frame.custom_round_delay_scale_marker
-        round_delay_marker.configure(text=f'{new_value}s')
+        self.configurations_frame.custom_round_delay_scale_marker.set_text(f'{new_value}s')
 
     def customize_starting_animals_checkbox_command(self) -> None:
         """
@@ -730,117 +714,19 @@ class WidgetCommands:
         if box_checked == 1: # true
             self.settings.update_settings(('board', 'customized_starting_animals', 'on'))
 
-            self.configurations_frame.custom_predator_label.grid(
-                **self.configurations_frame.custom_predator_label_grid_info
-            )
-
-            self.configurations_frame.custom_predator_population_scale_label.grid(
-                **self.configurations_frame.custom_predator_population_scale_label_grid_info
-            )
-
-            self.configurations_frame.custom_predator_population_scale.grid(
-                **self.configurations_frame.custom_predator_population_scale_grid_info
-            )
-
-            self.configurations_frame.predator_population_scale_marker.grid(
-                **self.configurations_frame.predator_population_scale_marker_grid_info
-            )
-
-            self.configurations_frame.custom_predator_level_scale_label.grid(
-                **self.configurations_frame.custom_predator_level_scale_label_grid_info
-            )
-
-            self.configurations_frame.custom_predator_level_scale.grid(
-                **self.configurations_frame.custom_predator_level_scale_grid_info
-            )
-
-            self.configurations_frame.predator_level_scale_marker.grid(
-                self.configurations_frame.predator_level_scale_marker_grid_info
-            )
-
-            self.configurations_frame.custom_predator_starvation_scale_label.grid(
-                **self.configurations_frame.custom_predator_starvation_scale_label_grid_info
-            )
-
-            self.configurations_frame.custom_predator_starvation_scale.grid(
-                **self.configurations_frame.custom_predator_starvation_scale_grid_info
-            )
-
-            self.configurations_frame.starvation_scale_marker.grid(
-                **self.configurations_frame.starvation_scale_marker_grid_info
-            )
-
-            self.configurations_frame.custom_prey_label.grid(
-                **self.configurations_frame.custom_prey_label_grid_info
-            )
-
-            self.configurations_frame.custom_prey_population_scale_label.grid(
-                **self.configurations_frame.custom_prey_population_scale_label_grid_info
-            )
-
-            self.configurations_frame.custom_prey_population_scale.grid(
-                **self.configurations_frame.custom_prey_population_scale_grid_info
-            )
-
-            self.configurations_frame.prey_population_scale_marker.grid(
-                **self.configurations_frame.prey_population_scale_marker_grid_info
-            )
-
-            self.configurations_frame.custom_prey_level_scale_label.grid(
-                **self.configurations_frame.custom_prey_level_scale_label_grid_info
-            )
-
-            self.configurations_frame.custom_prey_level_scale.grid(
-                **self.configurations_frame.custom_prey_level_scale_grid_info
-            )
-
-            self.configurations_frame.prey_level_scale_marker.grid(
-                **self.configurations_frame.prey_level_scale_marker_grid_info
-            )
+            self.configurations_frame.show_widgets(*self.configurations_frame.animals_section)
 
         else: # false
             # hiding widgets
             self.settings.update_settings(('board', 'customized_starting_animals', 'off'))
 
-            self.configurations_frame.custom_predator_label.grid_forget()
-
-            self.configurations_frame.custom_predator_population_scale_label.grid_forget()
-
-            self.configurations_frame.custom_predator_population_scale.grid_forget()
-
-            self.configurations_frame.predator_population_scale_marker.grid_forget()
-
-            self.configurations_frame.custom_predator_level_scale_label.grid_forget()
-
-            self.configurations_frame.custom_predator_level_scale.grid_forget()
-
-            self.configurations_frame.predator_level_scale_marker.grid_forget()
-
-            self.configurations_frame.custom_predator_starvation_scale_label.grid_forget()
-
-            self.configurations_frame.custom_predator_starvation_scale.grid_forget()
-
-            self.configurations_frame.starvation_scale_marker.grid_forget()
-
-            self.configurations_frame.custom_prey_label.grid_forget()
-
-            self.configurations_frame.custom_prey_population_scale_label.grid_forget()
-
-            self.configurations_frame.custom_prey_population_scale.grid_forget()
-
-            self.configurations_frame.prey_population_scale_marker.grid_forget()
-
-            self.configurations_frame.custom_prey_level_scale_label.grid_forget()
-
-            self.configurations_frame.custom_prey_level_scale.grid_forget()
-
-            self.configurations_frame.prey_level_scale_marker.grid_forget()
+            self.configurations_frame.hide_widgets(*self.configurations_frame.animals_section)
 
             # restoring all default animal starting stats and
             # updating scales and scale markers to their default set points and max
             self.predator_population_scale_command(self.default_settings['predator']['num_initial_predators'])
             self.configurations_frame.custom_predator_population_scale.set(self.settings.num_initial_predators)
-            self.configurations_frame.custom_predator_population_scale.configure(to=(self.settings.board_length**2)*4)
+            self.configurations_frame.custom_predator_population_scale.configure(to=self.settings.max_population)
 
             self.predator_level_scale_command(self.default_settings['predator']['predator_starting_level'])
             self.configurations_frame.custom_predator_level_scale.set(self.settings.predator_starting_level)
@@ -850,7 +736,7 @@ class WidgetCommands:
 
             self.prey_population_scale_command(self.default_settings['prey']['num_initial_prey'])
             self.configurations_frame.custom_prey_population_scale.set(self.settings.num_initial_prey)
-            self.configurations_frame.custom_prey_population_scale.configure(to=(self.settings.board_length**2)*4)
+            self.configurations_frame.custom_prey_population_scale.configure(to=self.settings.max_population)
 
             self.prey_level_scale_command(self.default_settings['prey']['prey_starting_level'])
             self.configurations_frame.custom_prey_level_scale.set(self.settings.prey_starting_level)
@@ -863,11 +749,9 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('predator', 'num_initial_predators', new_value))
         # modifying configurations display
-        population_scale_marker = self.configurations_frame.predator_population_scale_marker
-        population_scale_marker.configure(text=new_value)
+        self.configurations_frame.predator_population_scale_marker.set_text(new_value)
         # modifying scoreboard display
-        scoreboard_level_marker = self.scoreboard_frame.predator_population_marker
-        scoreboard_level_marker.configure(text=new_value)
+        self.view.right_menu_frame.get_scoreboard().set_marker('predator_population', new_value)
 
     def predator_level_scale_command(self, value: str) -> None:
         """
@@ -877,11 +761,9 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('predator', 'predator_starting_level', new_value))
         # modifying configurations display
-        level_scale_marker = self.configurations_frame.predator_level_scale_marker
-        level_scale_marker.configure(text=new_value)
+        self.configurations_frame.predator_level_scale_marker.set_text(new_value)
         # modifying scoreboard display
-        scoreboard_level_marker = self.scoreboard_frame.predator_level_marker
-        scoreboard_level_marker.configure(text=new_value)
+        self.view.right_menu_frame.get_scoreboard().set_marker('predator_level', new_value)
 
     def predator_starvation_scale_command(self, value: str) -> None:
         """
@@ -891,11 +773,9 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('predator', 'rounds_until_starvation', new_value))
         # modifying configurations display
-        starvation_scale_marker = self.configurations_frame.starvation_scale_marker
-        starvation_scale_marker.configure(text=new_value)
+        self.configurations_frame.starvation_scale_marker.set_text(new_value)
         # modifying scoreboard display
-        scoreboard_starvation_marker = self.scoreboard_frame.predator_starvation_marker
-        scoreboard_starvation_marker.configure(text=new_value)
+        self.view.right_menu_frame.get_scoreboard().set_marker('predator_starvation', new_value)
             
     def prey_population_scale_command(self, value: str) -> None:
         """
@@ -905,11 +785,9 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('prey', 'num_initial_prey', new_value))
         # modifying configurations display
-        population_scale_marker = self.configurations_frame.prey_population_scale_marker
-        population_scale_marker.configure(text=new_value)
+        self.configurations_frame.prey_population_scale_marker.set_text(new_value)
         # modifying scoreboard display
-        scoreboard_population_marker = self.scoreboard_frame.prey_population_marker
-        scoreboard_population_marker.configure(text=new_value)
+        self.view.right_menu_frame.get_scoreboard().set_marker('prey_population', new_value)
 
     def prey_level_scale_command(self, value: str) -> None:
         """
@@ -919,11 +797,9 @@ class WidgetCommands:
         new_value = round(float(value))
         self.settings.update_settings(('prey', 'prey_starting_level', new_value))
         # modifying configurations display
-        level_scale_marker = self.configurations_frame.prey_level_scale_marker
-        level_scale_marker.configure(text=new_value)
+        self.configurations_frame.prey_level_scale_marker.set_text(new_value)
         # modifying scoreboard display
-        scoreboard_level_marker = self.scoreboard_frame.prey_level_marker
-        scoreboard_level_marker.configure(text=new_value)
+        self.view.right_menu_frame.get_scoreboard().set_marker('prey_level', new_value)
 
 
 if __name__ == "__main__":
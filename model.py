@@ -21,6 +21,7 @@ from random import randrange
 from collections import defaultdict
 from abc import ABC, abstractmethod
 from json import load, dump
+from functools import cached_property
 from exceptions import SettingNotFound
 
 
@@ -93,6 +94,8 @@ class CurrentSettings:
         """
         # default settings are pulled everytime the program is started
         self.all_settings_dict = CurrentSettings.default_settings()
+        # the board length is reset, so the max population must be recalculated
+        self.__dict__.pop('max_population', None)
         # assigning all the settings to their value for quick access
         for inner_dict in self.all_settings_dict.values():
             for second_key, value in inner_dict.items():
@@ -123,6 +126,17 @@ class CurrentSettings:
         self.all_settings_dict[first_settings_key][second_settings_key] = new_user_setting
         # modifying the object's specific setting attribute
         setattr(self, second_settings_key, new_user_setting)
+        # the max population depends on the board length
+        if second_settings_key == 'board_length':
+            self.__dict__.pop('max_population', None)
+
+    @cached_property
+    def max_population(self) -> int:
+        """
+        The max population of each animal for the current board length - 4 per square
+        Cached until the board length is changed by update_settings()
+        """
+        return self.board_length * self.board_length * 4
 
     def write_game_settings(self, settings_filename_to_update='game_settings_logs/user_configurations.json') -> None:
         """
@@ -449,8 +463,8 @@ class BoardModel:
             # checking preconditions
             assert self.settings.predator_starting_level >= 0
             assert self.settings.prey_starting_level >= 0
-            assert 0 <= self.settings.num_initial_predators <= (self.settings.board_length ** 2) * 4
-            assert 0 <= self.settings.num_initial_prey <= (self.settings.board_length ** 2) * 4
+            assert 0 <= self.settings.num_initial_predators <= self.settings.max_population
+            assert 0 <= self.settings.num_initial_prey <= self.settings.max_population
             # adding customized animals
             for _ in range(self.settings.num_initial_predators):
                 animals[0].append(PredatorModel(self.settings.predator_starting_level, 0, self.settings.rounds_until_starvation))
@@ -469,8 +483,8 @@ class BoardModel:
             - 0 <= Prey population <= board squares * 4 (squares can hold a maximum of 4 prey)
         """
         # checking population cap
-        assert 0 <= len(self.survivors[0]) <= (self.settings.board_length ** 2) * 4
-        assert 0 <= len(self.survivors[1]) <= (self.settings.board_length ** 2) * 4
+        assert 0 <= len(self.survivors[0]) <= self.settings.max_population
+        assert 0 <= len(self.survivors[1]) <= self.settings.max_population
         # randomly adding every surviving predator to board
         for predator in self.survivors[0]:
             random_x, random_y = (randrange(self.settings.board_length), randrange(self.settings.board_length))
@@ -532,7 +546,7 @@ class BoardModel:
                 self.survivors[1].extend(square.prey)
 
         # checking the population cap and removing lowest level animals over the limit
-        population_cap = (self.settings.board_length ** 2) * 4
+        population_cap = self.settings.max_population
         num_living_predators = len(self.survivors[0])
         num_living_prey = len(self.survivors[1])
         # sorting predators and prey by descending level
@@ -11,7 +11,7 @@ from model import BoardModel, CurrentSettings
 from exceptions import SettingNotFound
 from controller import Controller
 from model import BoardModel, CurrentSettings
-from view import View
+from view import View, scoreboard_stats
 
 def test_update_settings():
     """
@@ -36,6 +36,23 @@ def test_update_settings():
     with pytest.raises(SettingNotFound):
         modified_settings.update_settings(('predator', 'non-existent-key', 10))
 
+def test_max_population():
+    """
+    Tests the CurrentSettings max_population property is recalculated when the board length changes
+    """
+    settings = CurrentSettings()
+    assert settings.max_population == (settings.board_length ** 2) * 4
+
+    settings.update_settings(('board', 'board_length', 3))
+    assert settings.max_population == 36
+    # other settings don't affect the max population
+    settings.update_settings(('predator', 'num_initial_predators', 10))
+    assert settings.max_population == 36
+
+    # resetting the settings resets the max population
+    settings.__init__()
+    assert settings.max_population == (settings.board_length ** 2) * 4
+
 def test_create_animals():
     """
     Tests create_animals() to ensure it works with default settings and user customizations
@@ -76,5 +93,25 @@ def test_create_animals():
     assert dict(predator_levels_to_populations) == {6: 10}
     assert dict(prey_levels_to_populations) == {8: 5}
 
+def test_scoreboard_stats_extinct_predators():
+    """
+    Tests scoreboard_stats() keeps the levels and satiety as floats once every predator is extinct
+    """
+    settings = CurrentSettings()
+    board = BoardModel(settings)
+    # every predator has starved - the model's average satiety is the int 0
+    board.survivors = ([], board.create_animals()[1])
+    board.calculate_total_populations()
+    board.calculate_average_levels()
+    board.calculate_average_hunger_level()
+    assert board.average_hunger_level == 0
+
+    stats = dict(scoreboard_stats(board.total_populations, board.average_levels, board.average_hunger_level))
+    # ensuring each stat is displayed as it was before the predators went extinct
+    assert {marker: str(value) for marker, value in stats.items()} == {
+        'predator_population': '0', 'prey_population': '16',
+        'predator_level': '0.0', 'prey_level': '5.0', 'predator_starvation': '0.0'
+    }
+
 if __name__ == '__main__':
     pytest.main(['tester_files/test_model_classes.py'])
\ No newline at end of file
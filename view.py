@@ -6,29 +6,335 @@ Classes related to the view of the natural selection simulation
 View class frame heirarchy:
 
 - View(tk.Tk)
-    - BoardView(tk.Frame)
-        - SquareView(tk.Frame) (# of Tile objects = board dimensions)
-            - PredatorView(tk.Frame) (# of Predator objects in the tile)
-            - PreyView(tk.Canvas) (# of Prey objects in the tile)
-    - Title(tk.Frame)
-    - LeftMenu(tk.Frame)
-        - GameControls(tk.Frame)
-        - Configurations(tk.Frame)
-    - RightMenu(tk.Frame)
-        - ScoreBoard(tk.Frame)
-        - BoardKey(tk.Frame)
-            - PredatorView(tk.Frame)
-            - PreyView(tk.Canvas)
+    - BoardView(tk.Canvas)
+        - SquareView (# of Tile objects = board dimensions, drawn on the BoardView canvas)
+            - PredatorView(PawnView) (# of Predator objects in the tile, drawn on the BoardView canvas)
+            - PreyView(PawnView) (# of Prey objects in the tile, drawn on the BoardView canvas)
+    - Title(ttk.Frame)
+    - LeftMenu(ttk.Frame)
+        - GameControls(ToggleFrame)
+        - Configurations(ToggleFrame)
+    - RightMenu(ttk.Frame)
+        - ScoreBoard(ttk.Frame) (round and stats drawn on one tk.Canvas)
+        - BoardKey(ttk.Frame) (pawn and symbol key drawn on one tk.Canvas)
 """
 
-import webbrowser
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import random
+from abc import ABC, abstractmethod
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
 from model import CurrentSettings, SquareModel, PredatorModel, PreyModel
 from typing import Callable
 
 
+# shared Font objects of the current tk root - filled by create_fonts() and bold_arial_font() once the root exists
+FONTS: dict[str, tkfont.Font] = {}
+
+
+def create_fonts(settings: 'CurrentSettings') -> None:
+    """
+    Creates the Font objects shared by the menu widgets
+    Tk resolves a font tuple into a new font for every widget it's passed to,
+    whereas a Font object is only resolved once and is reused by every widget
+
+    Must be called after the tk root window exists - any fonts of a previous root are discarded
+
+    Parameters:
+    settings: the game's settings holding the title's font
+    """
+    FONTS.clear()
+    font_options = {
+        'arial_7_bold': {'size': 7, 'weight': 'bold'},
+        'arial_8_bold': {'size': 8, 'weight': 'bold'},
+        'arial_11': {'size': 11},
+        'arial_11_bold': {'size': 11, 'weight': 'bold'},
+        'arial_12_bold': {'size': 12, 'weight': 'bold'},
+        'arial_13': {'size': 13},
+        'arial_13_bold': {'size': 13, 'weight': 'bold'},
+        'arial_14': {'size': 14},
+        'arial_14_bold': {'size': 14, 'weight': 'bold'},
+        'arial_15_bold': {'size': 15, 'weight': 'bold'},
+        'arial_16': {'size': 16},
+        'arial_16_bold': {'size': 16, 'weight': 'bold'},
+        'arial_18_bold': {'size': 18, 'weight': 'bold'},
+        'arial_29_underline': {'size': 29, 'underline': True},
+        'arial_32_underline': {'size': 32, 'underline': True},
+        'arial_39_underline': {'size': 39, 'underline': True}
+    }
+    for name, options in font_options.items():
+        FONTS[name] = tkfont.Font(family='Arial', **options)
+    # the title's font family is configurable
+    FONTS['title_12_bold'] = tkfont.Font(family=settings.title_font, size=12, weight='bold')
+    FONTS['title_45_bold'] = tkfont.Font(family=settings.title_font, size=45, weight='bold')
+
+
+def bold_arial_font(size: int) -> tkfont.Font:
+    """
+    Returns the shared bold Arial Font of a size - used by the pawns and board labels,
+    whose font sizes depend on the board length and label
+    Each size's Font is only created the first time it's needed and is kept in FONTS
+    with the menu fonts, so it's discarded along with them when a new root's fonts are created
+
+    Must be called after create_fonts()
+
+    Parameters:
+    size: the font size
+    """
+    name = f'arial_{size}_bold'
+    font = FONTS.get(name)
+    if font is None:
+        font = FONTS[name] = tkfont.Font(family='Arial', size=size, weight='bold')
+    return font
+
+
+def create_styles(settings: 'CurrentSettings') -> None:
+    """
+    Configures the named ttk styles of the menu widgets
+    Widgets reference a style by name instead of each widget storing its own background and font
+    Styles are shared by the whole program, so they're only configured once when the view is created
+
+    Must be called after create_fonts()
+
+    Parameters:
+    settings: the game's settings holding the menu background colors
+    """
+    style = ttk.Style()
+    # menu buttons, scales, and comboboxes
+    widget_background_color = settings.widget_background_color
+    style.configure('TButton', background=widget_background_color, font=FONTS['arial_14_bold'])
+    style.configure('TScale', background=widget_background_color)
+    style.configure('TCombobox', fieldbackground=widget_background_color, font=FONTS['arial_12_bold'])
+    style.configure('highlighted_button.TButton', background='DarkGoldenrod3', font=FONTS['arial_14_bold'])
+    style.configure('reset_settings.TButton', background=widget_background_color, font=FONTS['arial_13_bold'])
+    # menu frames - their borders are drawn by the frame itself and their background by the style
+    frame_backgrounds = {
+        'Title.TFrame': settings.title_background_color,
+        'LeftMenu.TFrame': settings.left_menu_background_color,
+        'GameControls.TFrame': settings.game_controls_background_color,
+        'Configurations.TFrame': settings.customize_settings_background_color,
+        'RightMenu.TFrame': settings.right_menu_background_color,
+        'ScoreBoard.TFrame': settings.scoreboard_background_color,
+        'BoardKey.TFrame': settings.boardkey_background_color
+    }
+    for frame_style, background_color in frame_backgrounds.items():
+        style.configure(frame_style, background=background_color)
+    # title labels
+    title_background = settings.title_background_color
+    style.configure('Title.TLabel', background=title_background, font=FONTS['title_12_bold'])
+    style.configure('Title.Link.TLabel', background=title_background, font=FONTS['title_12_bold'],
+                    foreground='dodgerblue3')
+    style.configure('Title.Header.TLabel', background=title_background, font=FONTS['title_45_bold'],
+                    foreground=settings.title_font_color)
+    # left menu advisory label
+    style.configure('LeftMenu.Advisory.TLabel', background=settings.left_menu_background_color,
+                    font=FONTS['arial_11'], foreground='darkorange3')
+    # game controls labels
+    game_controls_background = settings.game_controls_background_color
+    style.configure('GameControls.Header.TLabel', background=game_controls_background, font=FONTS['arial_16_bold'])
+    style.configure('GameControls.Title.TLabel', background=game_controls_background, font=FONTS['arial_39_underline'])
+    # customize settings labels
+    configurations_background = settings.customize_settings_background_color
+    style.configure('Configurations.TLabel', background=configurations_background, font=FONTS['arial_13'])
+    style.configure('Configurations.Header.TLabel', background=configurations_background, font=FONTS['arial_16'])
+    style.configure('Configurations.Title.TLabel', background=configurations_background, font=FONTS['arial_39_underline'])
+    style.configure('Configurations.TCheckbutton', background=configurations_background, font=FONTS['arial_18_bold'])
+    # keeping the background the same while the mouse is over a checkbutton
+    style.map('Configurations.TCheckbutton', background=[('active', configurations_background)])
+
+
+# text of the labels displayed over the board for each winner
+ROUND_WINNER_TEXT = MappingProxyType({
+    'predator': 'Round Winner:\n    Predators!',
+    'prey': 'Round Winner:\n        Prey!',
+    'tie': 'Round Winner:\n         Tie!'
+})
+GAME_WINNER_TEXT = MappingProxyType({
+    'predator': 'Game Winner:\n   Predators!',
+    'prey': 'Game Winner:\n        Prey!',
+    'tie': 'Game Winner:\n         Tie!'
+})
+
+
+# sorting key for animal models
+SKILL_LEVEL_KEY = attrgetter('skill_level')
+
+# relative placements of the pawns in a square, in order of descending level (see SquareView.create_animals)
+PREDATOR_SLOTS = ((0.05, 0.05), (0.05, 0.375), (0.05, 0.7),
+                  (0.375, 0.7), (0.375, 0.375), (0.375, 0.05),
+                  (0.7, 0.05), (0.7, 0.375), (0.7, 0.7))
+PREY_SLOTS = ((0.7, 0.05), (0.7, 0.375), (0.7, 0.7))
+FOUR_PREY_SLOTS = ((0.375, 0.05), (0.7, 0.05), (0.7, 0.375), (0.7, 0.7))
+
+
+@lru_cache(maxsize=None)
+def checker_color_grid(board_length: int, checker_color_1: str, checker_color_2: str) -> tuple[tuple[str, ...], ...]:
+    """
+    Returns the color of every board square indexed by [x][y] - squares where x-y is odd get the first checker color
+    The colors only depend on the board length and checker colors so they're only worked out once per combination
+
+    Parameters:
+    board_length: the number of squares on each side of the board
+    checker_color_1: the color of the squares where x-y is odd
+    checker_color_2: the color of the squares where x-y is even
+    """
+    checker_colors = (checker_color_2, checker_color_1)
+    return tuple(tuple(checker_colors[(x-y) % 2] for y in range(board_length)) for x in range(board_length))
+
+
+@lru_cache(maxsize=None)
+def predator_pawn_sizes(board_length: int) -> tuple[int, int, int, tuple[int, int], tuple[int, int]]:
+    """
+    Returns the sizes used to draw a predator pawn - they only depend on the board length so they're only worked out once per board length:
+        - border thickness
+        - level label font size
+        - birth label font size
+        - level label padding (x, y) from the bottom right of the pawn
+        - birth label padding (x, y) from the top left of the pawn
+
+    Parameters:
+    board_length: the number of squares on each side of the board
+    """
+    if board_length < 3:
+        border_thickness = 4
+    elif board_length < 6:
+        border_thickness = 3
+    else:
+        border_thickness = 2
+
+    if board_length > 4:
+        level_label_font_size = 40//board_length
+        birth_label_font_size = 30//board_length
+    else:
+        level_label_font_size = 55//board_length
+        birth_label_font_size = 38//board_length
+
+    level_label_padding = (37//board_length, 20//board_length)
+    birth_label_padding = (30//board_length, 20//board_length)
+    return border_thickness, level_label_font_size, birth_label_font_size, level_label_padding, birth_label_padding
+
+
+@lru_cache(maxsize=None)
+def prey_pawn_sizes(board_length: int) -> tuple[int, int, int, tuple[int, int], tuple[int, int]]:
+    """
+    Returns the sizes used to draw a prey pawn - they only depend on the board length so they're only worked out once per board length:
+        - border thickness
+        - level label font size
+        - birth label font size
+        - level label padding (x, y) from the bottom right of the pawn
+        - birth label padding (x, y) from the top left of the pawn
+
+    Parameters:
+    board_length: the number of squares on each side of the board
+    """
+    if board_length < 3:
+        border_thickness = 4
+    elif board_length < 6:
+        border_thickness = 3
+    else:
+        border_thickness = 2
+
+    if board_length > 4:
+        level_label_font_size = 40//board_length
+        birth_label_font_size = 30//board_length
+        level_label_padding = (55//board_length, 40//board_length)
+        birth_label_padding = (57//board_length, 51//board_length)
+    else:
+        level_label_font_size = 55//board_length
+        birth_label_font_size = 38//board_length
+        level_label_padding = (58//board_length, 38//board_length)
+        birth_label_padding = (58//board_length, 48//board_length)
+    return border_thickness, level_label_font_size, birth_label_font_size, level_label_padding, birth_label_padding
+
+
+# display values of the checker color combobox
+CHECKER_COLOR_VALUES = ('Brown x White', 'Gray x White', 'Blue x White', 'Pink x White', 'Blue x Pink')
+# display value for each pair of checkered colors kept in the settings
+CHECKER_DISPLAY = MappingProxyType({
+    ('navajowhite4', 'mint cream'): 'Brown x White',
+    ('light slate gray', 'mint cream'): 'Gray x White',
+    ('sky blue', 'mint cream'): 'Blue x White',
+    ('thistle', 'mint cream'): 'Pink x White',
+    ('sky blue', 'thistle'): 'Blue x Pink'
+})
+# pair of checkered colors kept in the settings for each display value
+CHECKER_COLORS = MappingProxyType({display: colors for colors, display in CHECKER_DISPLAY.items()})
+
+
+@lru_cache(maxsize=None)
+def board_size_values(max_board_length: int) -> tuple[str, ...]:
+    """
+    Returns the display values of the board size combobox - from '1x1' up to the max board size
+    The values only depend on the max board length so they're only formatted once
+
+    Parameters:
+    max_board_length: the largest board length the user can choose
+    """
+    return tuple(f'{i}x{i}' for i in range(1, max_board_length+1))
+
+
+# grid options shared by every scale row of the customize settings menu - only the row and pady differ
+SCALE_LABEL_GRID = MappingProxyType({'column': 0, 'sticky': 'e', 'padx': 34, 'columnspan': 2})
+SCALE_GRID = MappingProxyType({'column': 1, 'sticky': 'e', 'padx': 25, 'columnspan': 3})
+SCALE_MARKER_GRID = MappingProxyType({'column': 0, 'sticky': 'e', 'columnspan': 3, 'padx': (0, 185)})
+
+# pages opened by the title's link labels
+GITHUB_URL = 'https://github.com/lmileski/natural_selection_board_game'
+GAME_DETAILS_URL = 'https://d.docs.live.net/3d8c06f048f6c577/Natural%20Selection%20Lab%20Automation.docx'
+REVIEW_FORM_URL = 'https://docs.google.com/forms/d/e/1FAIpQLSduCBih2TzSOCG_rc5sQ_SZZrGLK6um6K9d3Sa8OO_rdWQ7LQ/viewform?usp=sf_link'
+
+
+def open_link(url: str, event: tk.Event):
+    """
+    Opens a link label's page in the web browser - shared by every link label
+    webbrowser is only imported once a link is clicked since it's slow to import at startup
+
+    Parameters:
+    url: the page to open
+    event: the label's click event
+    """
+    import webbrowser
+    webbrowser.open(url)
+
+
+# scoreboard text colors for a stat that decreased, didn't change, or increased over the round
+SCORE_CHANGE_COLORS = ('red', 'gray27', 'green')
+
+
+def score_change_color(current_value: int | float, previous_value: int | float) -> str:
+    """
+    Returns the scoreboard text color for a stat's change over the round
+    The sign of the change is used as the index into SCORE_CHANGE_COLORS
+
+    Parameters:
+    current_value: the stat's value at the end of the round
+    previous_value: the stat's value at the start of the round
+    """
+    return SCORE_CHANGE_COLORS[(current_value > previous_value) - (current_value < previous_value) + 1]
+
+
+def scoreboard_stats(total_populations: tuple[int, int], average_levels: tuple[float, float],
+                     average_hunger_level: float) -> tuple[tuple[str, int | float], ...]:
+    """
+    Returns each scoreboard stat paired with its new value in the order they're updated
+    Populations are displayed as ints and levels and satiety as floats - the model's
+    average satiety is the int 0 once every predator is extinct but is still displayed as 0.0
+
+    Parameters:
+    total_populations: the predator and prey populations
+    average_levels: the predator and prey average levels
+    average_hunger_level: the predators' average satiety
+    """
+    return (('predator_population', int(total_populations[0])),
+            ('prey_population', int(total_populations[1])),
+            ('predator_level', float(average_levels[0])),
+            ('prey_level', float(average_levels[1])),
+            ('predator_starvation', float(average_hunger_level)))
+
+
 class View(tk.Tk):
     """
     Holds the tkinter GUI for the game
@@ -40,6 +346,9 @@ class View(tk.Tk):
         self.settings = settings
         # setting View object up as a tkinter window
         super().__init__()
+        # creating the fonts and styles shared by the menus - requires the tk root
+        create_fonts(settings)
+        create_styles(settings)
         self.title('Natural Selection Game Simulation')
         self.state('zoomed') # fullscreen including exit button and title
 
@@ -50,128 +359,204 @@ class View(tk.Tk):
         self.right_menu_frame = RightMenu(self)
 
 
-class BoardView(tk.Frame):
+class BoardView(tk.Canvas):
     """
     Holds the gameboard display
+    Every square, pawn, and square winner symbol is an item drawn on this one canvas
     """
 
     parent: View
     board_data: list[list[SquareModel]] # attributed when start game button is pressed
     board_visuals_2d: list[list['SquareView']] # attributed when draw board method is called
     board_visuals_1d: list['SquareView'] # attributed when the draw board method is called
-    board_visuals_diagonal_matrix: list[list['SquareView']] # attributed when the draw board method is called
+    board_visuals_diagonal_order: list['SquareView'] # attributed when the draw board method is called
+    diagonal_section_starts: list[int] # index in board_visuals_diagonal_order where each diagonal section starts
+    square_pool: dict[tuple[int, int], 'SquareView'] # board coordinates -> square view, reused between redraws
+    pawn_pool: dict[int, 'PredatorView | PreyView'] # id of an animal model -> its piece, hidden and reused between redraws
     animal_pawns_to_erase: list['PredatorView | PreyView']
     scheduled_tasks: list[str] # for storing scheduled visuals so that they may be cancelled at anytime
-    scheduled_labels: list['ttk.Label | tk.Canvas | PredatorView | PreyView'] # same but for labels
+    board_labels: dict[str, ttk.Label] # label slot -> label displayed over the board, created on first display
+    shuffle_pawns: Callable[[list], None] # bound shuffle of the board's own random generator
+    pawns_per_tick: int = 4 # pawns drawn/erased per scheduled task when scattering/collecting pawns
+    border_width: int = 3 # the squares are drawn inside of the board's border
+    square_width: float # pixel size of every square - updated whenever the board is resized
+    square_height: float
+    square_inner_width: float # pixel size of the inside of every square's border
+    square_inner_height: float
+    pawn_width: float # pixel size shared by every pawn - a quarter of a square's inside
+    pawn_height: float
+    pending_size: tuple[int, int] # latest canvas size from a configure event - laid out once tk is idle
+    resize_task: str | None # scheduled layout of the board for the pending size, if any
 
     def __init__(self, parent: View):
         # setting parent frame for settings retrieval
         self.parent = parent
         self.board_visuals_1d = []
+        self.square_pool = {}
+        self.pawn_pool = {}
         self.animal_pawns_to_erase = []
         # for reset game button
         self.scheduled_tasks = []
-        self.scheduled_labels = []
-        # assigning its own frame to the parent and setting its border
-        super().__init__(parent, bd=3, relief='solid')
+        self.board_labels = {}
+        # the board's own random generator for the random order of pawns being placed/collected
+        self.shuffle_pawns = random.Random().shuffle
+        # assigning its own canvas to the parent and setting its border
+        super().__init__(parent, bd=self.border_width, relief='solid', highlightthickness=0)
         # drawing the board (without animals)
         self.draw_board()
+        # fitting the board's items to the canvas whenever it's resized
+        self.resize_task = None
+        self.bind('<Configure>', self.resize_board)
         # placing itself in the window
         self.place(relx=0.3, rely=0.1, relwidth=0.56, relheight=0.9)
 
+    def measure_squares(self, width: int, height: int):
+        """
+        Finds the pixel size of every square from the size of the canvas
+
+        Parameters:
+            - width (int): the width of the canvas, including its border
+            - height (int): the height of the canvas, including its border
+        """
+        board_length = self.parent.settings.board_length
+        self.square_width = max(width - 2*self.border_width, 0) / board_length
+        self.square_height = max(height - 2*self.border_width, 0) / board_length
+        # every square has the same inside and every pawn takes up a quarter of it - measuring them once for all pawns
+        self.square_inner_width = max(self.square_width - 2*SquareView.border_width, 0)
+        self.square_inner_height = max(self.square_height - 2*SquareView.border_width, 0)
+        self.pawn_width = self.square_inner_width*0.25
+        self.pawn_height = self.square_inner_height*0.25
+
+    def square_bounds(self, x: int, y: int) -> tuple[float, float, float, float]:
+        """
+        Returns the top left and bottom right canvas coordinates of a square
+
+        Parameters:
+            - x (int): the column of the square
+            - y (int): the row of the square
+        """
+        x0 = self.border_width + x*self.square_width
+        y0 = self.border_width + y*self.square_height
+        return x0, y0, x0 + self.square_width, y0 + self.square_height
+
+    def resize_board(self, event: tk.Event):
+        """
+        Schedules the board's items to be fit to the canvas's new size once tk is idle
+        Resizing the window sends a configure event for every step of the resize - the items are
+        only laid out once for the latest size instead of for each event
+        """
+        self.pending_size = (event.width, event.height)
+        if self.resize_task is None:
+            self.resize_task = self.after_idle(self.layout_board)
+
+    def layout_board(self):
+        """
+        Moves and resizes every item on the board to fit the canvas's latest size
+        """
+        self.resize_task = None
+        self.measure_squares(*self.pending_size)
+        for square_view in self.board_visuals_1d:
+            square_view.layout()
+
     def draw_board(self):
         """
-        Clears and redraws all Tile frames on the board
+        Redraws all squares on the board
+        Squares still on the board are recolored and reused, so only the squares
+        gained or lost by a change in board size are drawn or deleted
         """
         checker_color_1 = self.parent.settings.checkered_color1
         checker_color_2 = self.parent.settings.checkered_color2
         board_length = self.parent.settings.board_length
         
-        # clearing board
-        if self.board_visuals_1d:
-            for square_view in self.board_visuals_1d:
-                square_view.destroy() # removing from gui
+        # clearing only the squares that no longer fit on the board - the rest are recolored and reused
+        for position in [position for position in self.square_pool if max(position) >= board_length]:
+            self.square_pool.pop(position).destroy() # removing from gui
 
         self.board_visuals_1d = []
         self.board_visuals_2d = [[] for _ in range(board_length)]
 
-        # resetting all previous column and row weights to 0 - removes grid configuration
-        i = 0
-        while True:
-            try:
-                self.columnconfigure(i, weight=0)
-                i += 1
-            except:
-                break
+        # the size of each square depends on the board length
+        self.measure_squares(self.winfo_width(), self.winfo_height())
         
-        i = 0
-        while True:
-            try:
-                self.rowconfigure(i, weight=0)
-                i += 1
-            except:
-                break
-
-        # configuring the new grid for SquareView placement
-        for i in range(board_length):
-            self.rowconfigure(i, weight=1)
-            self.columnconfigure(i, weight=1)
-        
-        # adding all SquareView frames to the board
-        for x in range(board_length):
-            for y in range(board_length):
-                if (x-y) % 2 == 1:
-                    color = checker_color_1
+        # adding all squares to the board
+        color_grid = checker_color_grid(board_length, checker_color_1, checker_color_2)
+        for x, column_colors in enumerate(color_grid):
+            for y, color in enumerate(column_colors):
+                square_view = self.square_pool.get((x, y))
+                if square_view is None:
+                    square_view = SquareView(self, (x, y), color)
+                    self.square_pool[(x, y)] = square_view
                 else:
-                    color = checker_color_2
-                new_square_view = SquareView(self, (x, y), color)
-                self.board_visuals_2d[x].append(new_square_view)
+                    square_view.set_background_color(color)
+                    square_view.layout()
+                self.board_visuals_2d[x].append(square_view)
                 # creating a 1d array - needed for randomly placing animals
-                self.board_visuals_1d.append(new_square_view)
+                self.board_visuals_1d.append(square_view)
         
-        # creating a diagonal matrix for round change visuals - board results are shown from top left to bottom right
-        self.produce_diagonal_matrix()
+        # ordering the squares by diagonal section for round change visuals - board results are shown from top left to bottom right
+        self.produce_diagonal_order()
+
+    def prune_pawn_pool(self):
+        """
+        Destroys the pieces of animals that are no longer on any square and removes them from the pawn pool
+        Only the pieces of animals still on the board are kept for reuse - otherwise the pool would keep
+        every dead animal's canvas items and model for the rest of the game
+        """
+        pawns_on_board = {id(animal_pawn.data): animal_pawn for square_view in self.board_visuals_1d
+                          for animal_pawn in square_view.square_animal_views}
+        for animal_id, animal_pawn in self.pawn_pool.items():
+            if animal_id not in pawns_on_board:
+                animal_pawn.destroy()
+        self.pawn_pool = pawns_on_board
 
     def randomly_draw_all_animals(self):
         """
         Draws or erases all new animal pieces on the board randomly
         """
         # finding the delay between each pawns placement
-        random_pawn_placement_time = self.parent.settings.random_pawn_placement_time
-        total_population = self.parent.settings.num_initial_predators + self.parent.settings.num_initial_prey
+        settings = self.parent.settings
+        random_pawn_placement_time = settings.random_pawn_placement_time
+        total_population = settings.num_initial_predators + settings.num_initial_prey
         self.delay_between_pawns = random_pawn_placement_time//total_population if total_population != 0 else 0
         # grabbing a list of all animal pawns
         self.all_animal_pawns_to_change: list['PredatorView | PreyView'] = [] # type: ignore
         for square_view in self.board_visuals_1d:
-            for animal_pawn in square_view.square_animal_views:
-                self.all_animal_pawns_to_change.append(animal_pawn)
-                self.scheduled_labels.append(animal_pawn)
-
-        # randomly drawing all animals 1 by 1 at start of game
+            self.all_animal_pawns_to_change.extend(square_view.square_animal_views)
+        # shuffling once so pawns can be drawn in a random order by popping from the end
+        self.shuffle_pawns(self.all_animal_pawns_to_change)
+        # randomly drawing all animals a few at a time at start of game
         self.place_pawn()
     
     def randomly_collect_all_animals(self):
         """
         Erases all animal pieces on the board randomly
         """
+        # shuffling once so pawns can be erased in a random order by popping from the end
+        self.shuffle_pawns(self.animal_pawns_to_erase)
+        self.collect_pawn()
+
+    def collect_pawn(self):
+        """
+        Erases the next few pawns to erase then schedules itself
+        to be called again after the delay between each of those pawns
+        """
         if self.animal_pawns_to_erase:
-            # removing last pawn if it exists
+            # removing last pawn task if it exists
             try:
-                self.scheduled_tasks.remove(self.randomly_collect_all_animals_task)
+                self.scheduled_tasks.remove(self.collect_pawn_task)
             except:
                 pass
 
-            random_pawn = random.choice(self.animal_pawns_to_erase)
-            random_pawn.destroy()
-            self.animal_pawns_to_erase.remove(random_pawn)
-            # adding delay to placement
-            self.randomly_collect_all_animals_task = self.after(self.delay_between_pawns, self.randomly_collect_all_animals)
-            self.scheduled_tasks.append(self.randomly_collect_all_animals_task)
+            for _ in range(min(self.pawns_per_tick, len(self.animal_pawns_to_erase))):
+                self.animal_pawns_to_erase.pop().hide()
+            # adding delay to removal - same pacing as erasing the pawns one at a time
+            self.collect_pawn_task = self.after(self.delay_between_pawns*self.pawns_per_tick, self.collect_pawn)
+            self.scheduled_tasks.append(self.collect_pawn_task)
 
     def place_pawn(self):
         """
-        Draws a single pawn on a square then schedules itself
-        to be called again after the delay_between_pawn_placement
+        Draws the next few pawns on their squares then schedules itself
+        to be called again after the delay between each of those pawns
         """
         if self.all_animal_pawns_to_change:
             # removing last pawn task if it exists
@@ -179,12 +564,11 @@ class BoardView(tk.Frame):
                 self.scheduled_tasks.remove(self.place_pawn_task)
             except:
                 pass
-                
-            random_pawn = random.choice(self.all_animal_pawns_to_change)
-            random_pawn.draw_piece()
-            self.all_animal_pawns_to_change.remove(random_pawn)
-            # adding delay to placement
-            self.place_pawn_task = self.after(self.delay_between_pawns, self.place_pawn)
+
+            for _ in range(min(self.pawns_per_tick, len(self.all_animal_pawns_to_change))):
+                self.all_animal_pawns_to_change.pop().draw_piece()
+            # adding delay to placement - same pacing as drawing the pawns one at a time
+            self.place_pawn_task = self.after(self.delay_between_pawns*self.pawns_per_tick, self.place_pawn)
             self.scheduled_tasks.append(self.place_pawn_task)
     
     def diagonal_matrix_draw_all_results(self):
@@ -194,9 +578,9 @@ class BoardView(tk.Frame):
         Function to be called during the middle of every round to show each square's results
         """
         self.result_delay = self.parent.settings.delay_between_square_results_labels
-        self.num_diagonal_sections = len(self.board_visuals_diagonal_matrix)
-        # keeping track of previous symbols displayed to forget them after the delay between square results
-        self.previous_square_winner_symbols = []
+        self.num_diagonal_sections = len(self.diagonal_section_starts)-1
+        # keeping track of the squares displaying symbols to erase them after the delay between square results
+        self.previous_winner_squares: list['SquareView'] = [] # type: ignore
         # drawing
         self.draw_section_results()
 
@@ -211,47 +595,46 @@ class BoardView(tk.Frame):
             self.scheduled_tasks.remove(self.draw_section_results_task) # type: ignore
         except:
             pass
+        # erasing the last diagonal section's square result symbols - they're the only items with the symbol tag
+        if self.previous_winner_squares:
+            self.delete('symbol')
+            for square_view in self.previous_winner_squares:
+                square_view.square_winner_symbol_ids = ()
+            self.previous_winner_squares = []
+
         if index < self.num_diagonal_sections:
-            # making last diagonal section square result symbols disappear/destroy
-            for previous_square_winner_symbol in self.previous_square_winner_symbols:
-                previous_square_winner_symbol.destroy() # removes symbol from gui
-                
             # displaying current diagonal sections square results and new animals
-            for square_view in self.board_visuals_diagonal_matrix[index]:
+            section_start, section_end = self.diagonal_section_starts[index], self.diagonal_section_starts[index+1]
+            for square_view in self.board_visuals_diagonal_order[section_start:section_end]:
                 # (model has been updated by controller at this point)
-                # erasing old animals
-                square_view.erase_animals()
-                # creating new animal views
-                square_view.create_animals()
-                # drawing the new animal views
-                square_view.draw_animals()
-                # drawing result label
+                # redrawing the square's animals
+                square_view.refresh_animals()
+                # drawing result symbol
                 square_view.display_square_winner()
-                self.previous_square_winner_symbols.append(square_view.square_winner_canvas)
-                self.scheduled_labels.append(square_view.square_winner_canvas)
+                self.previous_winner_squares.append(square_view)
 
             # adding delay to square diagonal sections being displayed
             self.draw_section_results_task = self.after(self.result_delay, self.draw_section_results, index+1)
             self.scheduled_tasks.append(self.draw_section_results_task)
         else:
-            # forgetting any square symbols left (bottom right square)
-            board_length = self.parent.settings.board_length
-            last_square_i = board_length ** 2 - 1
-            self.previous_square_winner_symbols[last_square_i].destroy()
+            # every square has been redrawn - the dead animals' pieces are no longer needed
+            self.prune_pawn_pool()
 
-    def produce_diagonal_matrix(self):
+    def produce_diagonal_order(self):
         """
-        Reformats board_visuals_2d array into a separate diagonal matrix
+        Reformats board_visuals_2d array into a flat list of squares ordered by diagonal section
         Needed for displaying each squares results from top left of board to bottom right
+        Diagonal section i is board_visuals_diagonal_order[diagonal_section_starts[i]:diagonal_section_starts[i+1]]
         """
         # length is equal to the number of columns
         board_length = len(self.board_visuals_2d)
-        num_inner_lists = board_length*2-1
-        self.board_visuals_diagonal_matrix = [[] for _ in range(num_inner_lists)]
-        # finding the right inner list to place square views into
-        for x, column in enumerate(self.board_visuals_2d):
-            for y, square_view in enumerate(column):
-                self.board_visuals_diagonal_matrix[x+y].append(square_view)
+        self.board_visuals_diagonal_order = []
+        self.diagonal_section_starts = [0]
+        # every square in a diagonal section has the same x+y - walking up each section from its bottom left square
+        for section in range(board_length*2-1):
+            for x in range(max(0, section-board_length+1), min(section, board_length-1)+1):
+                self.board_visuals_diagonal_order.append(self.board_visuals_2d[x][section-x])
+            self.diagonal_section_starts.append(len(self.board_visuals_diagonal_order))
 
     def erase_all_animals(self):
         """
@@ -259,110 +642,117 @@ class BoardView(tk.Frame):
         """
         for square_view in self.board_visuals_1d:
             square_view.erase_animals()
+
+    def clear_visuals(self):
+        """
+        Erases every pawn and square winner symbol and hides the board labels
+        Needed when the reset and autofinish game buttons immediately stop the visuals
+        """
+        # deleting every pawn and symbol item at once then forgetting their views
+        self.delete('pawn', 'symbol')
+        for square_view in self.board_visuals_1d:
+            square_view.square_animal_views = []
+            square_view.drawn_animals_signature = None
+            square_view.square_winner_symbol_ids = ()
+        self.pawn_pool.clear()
+        self.animal_pawns_to_erase.clear()
+        self.hide_board_labels()
         
+    def show_board_label(self, slot: str, text: str, font_size: int):
+        """
+        Displays the board label of a slot over the whole board
+        Each slot's label is created on its first display and reused afterwards
+
+        Transparent label backgrounds unfortunately don't exist in tkinter :(
+
+        Parameters:
+            - slot (str): the name of the label to display - e.g. 'countdown' or 'round_winner'
+            - text (str): the text of the label
+            - font_size (int): the size of the label's bold Arial font
+        """
+        board_label = self.board_labels.get(slot)
+        if board_label is None:
+            background_color = self.parent.settings.countdown_background_color
+            board_label = ttk.Label(self, background=background_color, anchor='center')
+            self.board_labels[slot] = board_label
+
+        board_label.configure(text=text, font=bold_arial_font(font_size))
+        # covering the inside of the board's border
+        board_label.place(relx=0, rely=0, relwidth=1, relheight=1)
+        # raising the reused label above any labels displayed since it was created
+        board_label.lift()
+
+    def hide_board_label(self, slot: str):
+        """
+        Hides the board label of a slot if it has been created
+        """
+        board_label = self.board_labels.get(slot)
+        if board_label is not None:
+            board_label.place_forget()
+
+    def hide_board_labels(self):
+        """
+        Hides every board label - needed when the reset and autofinish game buttons clear the board
+        """
+        for board_label in self.board_labels.values():
+            board_label.place_forget()
+
     def display_game_countdown(self, num_to_display: int):
         """
         Draws a large number countdown center of the board
         Example countdown: 3, 2, 1, GO!
         To be called several times with the num_to_display being the current countdown label's int
-
-        Must create labels in same function to ensure proper level order of frames :(
-
-        Transparent label backgrounds unfortunately don't exist in tkinter :(
         """
-        board_length = self.parent.settings.board_length
-        background_color = self.parent.settings.countdown_background_color
         delay_of_number = (self.parent.settings.delay_between_board_labels*2)//3
         delay_of_go = int(self.parent.settings.delay_between_board_labels*1.5)
 
-        # forgetting the last countdown number displayed in last call if it exists (10 is max)
-        last_countdown_label: tk.Label | None = getattr(self, f'countdown_label_{num_to_display+1}', None)
-        if last_countdown_label:
-            last_countdown_label.grid_forget()
-
         # for all numbers from round_delay -> 1
         if num_to_display > 0:
-            # creating number label
-            new_label = ttk.Label(self, text=num_to_display, background=background_color, font=("Arial", 160, 'bold'), anchor='center')
-            self.scheduled_labels.append(new_label)
-            setattr(self, f'countdown_label_{num_to_display}', new_label)
-            # displaying next countdown number
-            self.countdown_label: tk.Label = getattr(self, f'countdown_label_{num_to_display}')
-            self.countdown_label.grid(column=0, row=0, columnspan=board_length, rowspan=board_length, sticky='nsew')
+            # displaying the countdown number in place of the last one
+            self.show_board_label('countdown', str(num_to_display), 160)
             # displaying the next countdown number after a half-second delay
             game_countdown_task = self.after(delay_of_number, self.display_game_countdown, num_to_display-1)
             self.scheduled_tasks.append(game_countdown_task)
 
         # for displaying GO!
         else:
-            # creating label
-            self.countdown_label_go = ttk.Label(self, text='GO!', background=background_color,
-                                            font=("Arial", 160, 'bold'), anchor='center')
-            self.scheduled_labels.append(self.countdown_label_go)
-            self.countdown_label_go.grid(column=0, row=0,
-                                         columnspan=board_length, rowspan=board_length, sticky='nsew')
+            self.show_board_label('countdown', 'GO!', 160)
             # adding delay then hiding go label
-            go_task = self.after(delay_of_go, lambda: self.countdown_label_go.grid_forget())
+            go_task = self.after(delay_of_go, self.hide_board_label, 'countdown')
             self.scheduled_tasks.append(go_task)
 
     def display_round_label(self, round_num: int):
         """
         Displays the round number in the center of the board
-
-        Must create labels in same function to ensure proper level order of frames
         """
-        board_length = self.parent.settings.board_length
         delay = self.parent.settings.delay_between_board_labels
-        background_color = self.parent.settings.countdown_background_color
-        # placing labels at specific time intervals
-        # creating label
-        self.round_label = ttk.Label(self, text='Round 1', background=background_color,
-                                    font=("Arial", 85, 'bold'), anchor='center')
-        self.scheduled_labels.append(self.round_label)
         # placing round label
-        self.round_label.configure(text=f'Round {round_num}')
-        self.round_label.grid(column=0, row=0,
-                                columnspan=board_length, rowspan=board_length, sticky='nsew')
+        self.show_board_label('round', f'Round {round_num}', 85)
         # adding delay
-        round_label_task = self.after(delay, lambda: self.round_label.grid_forget())
+        round_label_task = self.after(delay, self.hide_board_label, 'round')
         self.scheduled_tasks.append(round_label_task)    
     
     def display_scattering_pawns_label(self):
         """
         Displays the scattering pawns label
-
-        Must create labels in same function to ensure proper level order of frames
         """
-        board_length = self.parent.settings.board_length
         delay = self.parent.settings.delay_between_board_labels
-        background_color = self.parent.settings.countdown_background_color
-        # creating label
-        self.scattering_pawns_label = ttk.Label(self, text='Scattering\n   Pawns', background=background_color,
-                                            font=("Arial", 75, 'bold'), anchor='center')
-        self.scheduled_labels.append(self.scattering_pawns_label)
         # forgetting round label
-        self.round_label.grid_forget()
+        self.hide_board_label('round')
         # adding Scattering Pawns label
-        self.scattering_pawns_label.grid(column=0, row=0,
-                                        columnspan=board_length, rowspan=board_length, sticky='nsew')
-        # adding delay then forgetting the GO! label
-        scattering_pawns_task = self.after(delay, lambda: self.scattering_pawns_label.grid_forget())
+        self.show_board_label('scattering_pawns', 'Scattering\n   Pawns', 75)
+        # adding delay then forgetting the Scattering Pawns label
+        scattering_pawns_task = self.after(delay, self.hide_board_label, 'scattering_pawns')
         self.scheduled_tasks.append(scattering_pawns_task)
 
     def display_collecting_pawns_label(self):
         """
         Displays the collecting pawns label in the board frame
         """
-        board_length = self.parent.settings.board_length
         delay = self.parent.settings.delay_between_board_labels
-        background_color = self.parent.settings.countdown_background_color
-
-        self.collecting_pawns_label = ttk.Label(self, text='Collecting\n   Pawns', background=background_color,
-                                                font=("Arial", 75, 'bold'), anchor='center')
-        self.scheduled_labels.append(self.collecting_pawns_label)
-        self.collecting_pawns_label.grid(column=0, row=0,
-                                            columnspan=board_length, rowspan=board_length, sticky='nsew')
-        collecting_pawns_task = self.after(delay, lambda: self.collecting_pawns_label.grid_forget())
+
+        self.show_board_label('collecting_pawns', 'Collecting\n   Pawns', 75)
+        collecting_pawns_task = self.after(delay, self.hide_board_label, 'collecting_pawns')
         self.scheduled_tasks.append(collecting_pawns_task)
 
     def display_round_winner_label(self, winner: str):
@@ -375,34 +765,14 @@ class BoardView(tk.Frame):
                 - 'predator' or
                 - 'prey' or
                 - 'tie'
-        
-        Must create labels in same function to ensure proper level order of frames
         """
-        board_length = self.parent.settings.board_length
         delay = int(self.parent.settings.delay_between_board_labels * 2)
-        background_color = self.parent.settings.countdown_background_color
-
-        if winner == 'predator':
-            self.predator_label = ttk.Label(self, text='Round Winner:\n    Predators!', background=background_color,
-                                        font=("Arial", 75, 'bold'), anchor='center')
-            self.predator_label.grid(column=0, row=0,
-                                        columnspan=board_length, rowspan=board_length, sticky='nsew')
-        elif winner == 'prey':
-            self.prey_label = ttk.Label(self, text="Round Winner:\n        Prey!", background=background_color,
-                                    font=("Arial", 75, 'bold'), anchor='center')
-            self.prey_label.grid(column=0, row=0,
-                                    columnspan=board_length, rowspan=board_length, sticky='nsew')
-        elif winner == 'tie':
-            self.tie_label = ttk.Label(self, text="Round Winner:\n         Tie!", background=background_color,
-                                font=("Arial", 75, 'bold'), anchor='center')
-            self.tie_label.grid(column=0, row=0,
-                                columnspan=board_length, rowspan=board_length, sticky='nsew')
-        else:
-                raise ValueError("winner argument may only be 'predators', 'prey', or 'tie'")
-        
-        label_displayed = getattr(self, f'{winner}_label')
-        self.scheduled_labels.append(label_displayed)
-        winner_label_task = self.after(delay, lambda: label_displayed.grid_forget())
+
+        if winner not in ROUND_WINNER_TEXT:
+            raise ValueError("winner argument may only be 'predators', 'prey', or 'tie'")
+
+        self.show_board_label('round_winner', ROUND_WINNER_TEXT[winner], 75)
+        winner_label_task = self.after(delay, self.hide_board_label, 'round_winner')
         self.scheduled_tasks.append(winner_label_task)
 
     def display_game_winner_label(self, winner: str, method: str):
@@ -416,67 +786,98 @@ class BoardView(tk.Frame):
                 - 'tie'
             - method (str): the method to change the display - either
                 - 'show' or
-                - 'destroy'
-        
-        Must create labels in same function to ensure proper level order of frames
+                - 'hide'
         """
-        board_length = self.parent.settings.board_length
-        background_color = self.parent.settings.countdown_background_color
-
-        if winner == 'predator':
-            if method == 'show':
-                self.predator_label = ttk.Label(self, text='Game Winner:\n   Predators!', background=background_color,
-                                            font=("Arial", 75, 'bold'), anchor='center')
-                self.scheduled_labels.append(self.predator_label)
-                self.predator_label.grid(column=0, row=0,
-                                        columnspan=board_length, rowspan=board_length, sticky='nsew')
-            elif method == 'destroy':
-                self.predator_label.destroy()
-        elif winner == 'prey':
-            if method == 'show':
-                self.prey_label = ttk.Label(self, text="Game Winner:\n        Prey!", background=background_color,
-                                        font=("Arial", 75, 'bold'), anchor='center')
-                self.scheduled_labels.append(self.prey_label)
-                self.prey_label.grid(column=0, row=0,
-                                    columnspan=board_length, rowspan=board_length, sticky='nsew')
-            elif method == 'destroy':
-                self.prey_label.destroy()
-        elif winner == 'tie':
-            if method == 'show':
-                self.tie_label = ttk.Label(self, text="Game Winner:\n         Tie!", background=background_color,
-                                    font=("Arial", 75, 'bold'), anchor='center')
-                self.scheduled_labels.append(self.tie_label)
-                self.tie_label.grid(column=0, row=0,
-                                columnspan=board_length, rowspan=board_length, sticky='nsew')
-            elif method == 'destroy':
-                self.prey_label.destroy()
+        if winner not in GAME_WINNER_TEXT or method not in ('show', 'hide'):
+            raise ValueError("winner argument may only be 'predators', 'prey', or 'tie' and method argument may only be 'show' or 'hide'")
+
+        if method == 'show':
+            self.show_board_label('game_winner', GAME_WINNER_TEXT[winner], 75)
         else:
-                raise ValueError("winner argument may only be 'predators', 'prey', or 'tie' and method argument may only be 'show' or 'destroy'")
+            self.hide_board_label('game_winner')
 
 
-class SquareView(tk.Frame):
+class SquareView:
     """
-    Holds the presentation of a single board tile
+    Holds the presentation of a single board tile - drawn as a rectangle on the board's canvas
     """
 
     parent: BoardView
     square_data: SquareModel # attributed when start game button is pressed
     square_animal_views: list['PredatorView | PreyView'] # attributed when the create_animals() method is called
-    square_winner_canvas: tk.Canvas
+    square_winner_symbol_ids: tuple[int, ...] # canvas items of the displayed winner symbol - empty if not displayed
+    inner_origin: tuple[float, float] # canvas coordinates of the top left of the inside of the tile's border
+    drawn_animals_signature: tuple | None = None # what the square's pieces were last created to show - None if no pieces
+    displayed_winner: int # winner of the displayed symbol - 1 if prey, -1 if predators, 0 if tie - attributed when it's drawn
+    border_width: int = 4
 
     def __init__(self, parent: 'BoardView', position: tuple[int, int], background_color: str):
         """
-        Draws a tile on the Board frame in a specified grid cell
+        Draws a tile on the board's canvas at the specified board coordinates
         """
-        # setting parent frame for settings retrieval
+        # setting parent canvas for settings retrieval
         self.parent = parent
         self.background_color = background_color
-        # assigning the tile frame inside of the board frame and adding a border
-        super().__init__(parent, bd=4, relief='solid', background=self.background_color)
+        self.square_animal_views = []
+        self.square_winner_symbol_ids = ()
         # board coordinates (0-board_length)
         self.x, self.y = position
-        # placing itself fully in grid based off coordinates
-        self.grid(column=self.x, row=self.y, sticky='nsew')
+        # drawing the tile with a border - positioned by layout()
+        self.square_id = self.parent.create_rectangle(0, 0, 0, 0, fill=self.background_color, outline='black',
+                                                      width=self.border_width, tags='square')
+        self.layout()
+
+    def set_background_color(self, background_color: str):
+        """
+        Recolors the tile - used when the board is redrawn with this tile still on it
+        """
+        self.background_color = background_color
+        self.parent.itemconfigure(self.square_id, fill=background_color)
+
+    def inner_bounds(self) -> tuple[float, float, float, float]:
+        """
+        Returns the top left and bottom right canvas coordinates of the inside of the tile's border
+        """
+        x0, y0, x1, y1 = self.parent.square_bounds(self.x, self.y)
+        return x0 + self.border_width, y0 + self.border_width, x1 - self.border_width, y1 - self.border_width
+
+    def pawn_bounds(self, relative_placement: tuple[float, float]) -> tuple[float, float, float, float]:
+        """
+        Returns the top left and bottom right canvas coordinates of a pawn in the tile
+        All pawns have a relative side length of 0.25
+
+        Parameters:
+            - relative_placement (tuple[float, float]): the relative x and y of the pawn within the tile (0-1)
+        """
+        board = self.parent
+        x0, y0 = self.inner_origin
+        pawn_x0 = x0 + relative_placement[0]*board.square_inner_width
+        pawn_y0 = y0 + relative_placement[1]*board.square_inner_height
+        return pawn_x0, pawn_y0, pawn_x0 + board.pawn_width, pawn_y0 + board.pawn_height
+
+    def layout(self):
+        """
+        Positions the tile and everything drawn on it for the current size of the board
+        """
+        x0, y0, x1, y1 = self.parent.square_bounds(self.x, self.y)
+        # remembering where the inside of the tile starts for placing its pawns
+        self.inner_origin = (x0 + self.border_width, y0 + self.border_width)
+        # the rectangle's outline is centered on its coordinates - keeping it inside of the tile
+        half_border = self.border_width/2
+        self.parent.coords(self.square_id, x0 + half_border, y0 + half_border, x1 - half_border, y1 - half_border)
+        for animal_view in self.square_animal_views:
+            animal_view.layout()
+        self.layout_square_winner()
+
+    def destroy(self):
+        """
+        Removes the tile and everything drawn on it from the board
+        """
+        for animal_pawn in self.square_animal_views:
+            animal_pawn.destroy()
+        self.square_animal_views = []
+        self.erase_square_winner()
+        self.parent.delete(self.square_id)
 
     def create_animals(self):
         """
@@ -492,300 +893,347 @@ class SquareView(tk.Frame):
             the others are distributed down column 2
             
         There is a population cap of 4 prey and 4 predators per square at the start of the round
+        Any pawns beyond the square's 9 predator slots (or 4 prey slots) overlap on purpose by sharing
+        the last slot - an overcrowded square is still drawn instead of stopping the round's visuals
         All animal pawns have a relative side length of 0.25
         They are spaced from the parent frame's border by a length of 0.05
         They are spaced from each other by a length of 0.075
         """
-        # sorting by descending skill levels to format the animal pieces by level
-        self.square_data.predators.sort(reverse=True, key=lambda prey: prey.skill_level)
-        self.square_data.prey.sort(reverse=True, key=lambda predator: predator.skill_level)
+        # sorting by descending skill levels to format the animal pieces by level - remembering what they show
+        self.drawn_animals_signature = self.animals_signature()
         self.square_animal_views = []
         # nicknaming
         predators = self.square_data.predators
         prey = self.square_data.prey
-        predator_outline_color = self.parent.parent.settings.predator_outline_color
-        prey_background_color = self.parent.parent.settings.prey_background_color
-        prey_outline_color = self.parent.parent.settings.prey_outline_color
+        settings = self.parent.parent.settings
+        predator_outline_color = settings.predator_outline_color
+        prey_background_color = settings.prey_background_color
+        prey_outline_color = settings.prey_outline_color
+        pawn_pool = self.parent.pawn_pool
         # drawing predators from the top left
         for i, predator in enumerate(predators):
-            # finding placement and placing pawn according to pattern described in docstring
-            if i <= 2:
-                if i == 0:
-                    relative_placement = (0.05, 0.05)
-                elif i == 1:
-                    relative_placement = (0.05, 0.375)
-                else:
-                    relative_placement = (0.05, 0.7)
-            elif i <= 5:
-                if i == 3:
-                    relative_placement = (0.375, 0.7)
-                elif i == 4:
-                    relative_placement = (0.375, 0.375)
-                else:
-                    relative_placement = (0.375, 0.05)
+            # finding placement according to pattern described in docstring - extra predators overlap on the last slot
+            relative_placement = PREDATOR_SLOTS[min(i, len(PREDATOR_SLOTS)-1)]
+            # reusing the predator's piece if it's had one - otherwise creating it
+            predator_to_display = pawn_pool.get(id(predator))
+            if predator_to_display is None:
+                predator_to_display = PredatorView(self, relative_placement, predator, predator_outline_color)
+                pawn_pool[id(predator)] = predator_to_display
             else:
-                if i == 6:
-                    relative_placement = (0.7, 0.05)
-                elif i == 7:
-                    relative_placement = (0.7, 0.375)
-                else:
-                    relative_placement = (0.7, 0.7)
-
-            # creating animal to display and then adding it to the square's animal views list
-            predator_to_display = PredatorView(self, relative_placement, predator, predator_outline_color)
+                predator_to_display.move_to(self, relative_placement)
+            # adding it to the square's animal views list
             self.square_animal_views.append(predator_to_display)
         
 
-        # drawing predators from the top right
-        # not possible for there to be more than 4 predators at the end of the round
-        # finding placement and placing pawn according to pattern described in docstring
-        if len(prey) < 4:
-            for i, p in enumerate(prey):
-                if i == 0:
-                    relative_placement = (0.7, 0.05)
-                elif i == 1:
-                    relative_placement = (0.7, 0.375)
-                else:
-                    relative_placement = (0.7, 0.7)
-
-                # creating animal to display and then adding it to the square's animal views list
-                prey_to_display = PreyView(self, relative_placement, p, self.background_color, prey_background_color, prey_outline_color)
-                self.square_animal_views.append(prey_to_display)
-        else:
-            # special pattern change when there are 4 prey
-            for i, p in enumerate(prey):
-                if i == 0:
-                    relative_placement = (0.375, 0.05)
-                elif i == 1:
-                    relative_placement = (0.7, 0.05)
-                elif i == 2:
-                    relative_placement = (0.7, 0.375)
-                else:
-                    relative_placement = (0.7, 0.7)
+        # drawing prey from the top right
+        # not possible for there to be more than 4 prey at the end of the round
+        # special pattern change when there are 4 prey
+        prey_slots = PREY_SLOTS if len(prey) < 4 else FOUR_PREY_SLOTS
+        for i, p in enumerate(prey):
+            # extra prey overlap on the last slot like extra predators
+            relative_placement = prey_slots[min(i, len(prey_slots)-1)]
+            # reusing the prey's piece if it's had one - otherwise creating it
+            prey_to_display = pawn_pool.get(id(p))
+            if prey_to_display is None:
+                prey_to_display = PreyView(self, relative_placement, p, prey_background_color, prey_outline_color)
+                pawn_pool[id(p)] = prey_to_display
+            else:
+                prey_to_display.move_to(self, relative_placement)
+            # adding it to the square's animal views list
+            self.square_animal_views.append(prey_to_display)
 
-                # creating animal to display and then adding it to the square's animal views list
-                prey_to_display = PreyView(self, relative_placement, p, self.background_color, prey_background_color, prey_outline_color)
-                self.square_animal_views.append(prey_to_display)
+    def animals_signature(self) -> tuple:
+        """
+        Sorts the square's animals by descending skill level and returns everything their pieces display
+        Two equal signatures mean the square's pieces would be redrawn exactly the same
+        """
+        self.square_data.predators.sort(reverse=True, key=SKILL_LEVEL_KEY)
+        self.square_data.prey.sort(reverse=True, key=SKILL_LEVEL_KEY)
+        return (tuple((id(predator), predator.skill_level, predator.birth_round, predator.rounds_until_starvation)
+                      for predator in self.square_data.predators),
+                tuple((id(p), p.skill_level, p.birth_round) for p in self.square_data.prey))
 
     def draw_animals(self):
         """
-        Draws all animals in its own square frame
+        Draws all animals in its own square
         """
         for animal_view in self.square_animal_views:
             self.parent.animal_pawns_to_erase.append(animal_view)
-            self.parent.scheduled_labels.append(animal_view)
             animal_view.draw_piece()
-            animal_view.place(relx=animal_view.relative_placement[0], rely=animal_view.relative_placement[1])
+
+    def refresh_animals(self):
+        """
+        Redraws the square's animals for its updated square data
+        Surviving animals' pieces are moved and redrawn in place - only the pieces of
+        animals that are no longer in the square are hidden
+        Squares whose animals haven't changed since their pieces were created are left as they are
+        """
+        if self.square_animal_views and self.animals_signature() == self.drawn_animals_signature:
+            # still queuing the unchanged pieces to be collected at the end of the round
+            self.parent.animal_pawns_to_erase.extend(self.square_animal_views)
+            return
+        previous_animal_views = self.square_animal_views
+        self.create_animals()
+        current_animal_views = set(self.square_animal_views)
+        for animal_view in previous_animal_views:
+            if animal_view not in current_animal_views:
+                animal_view.hide()
+        self.draw_animals()
 
     def erase_animals(self):
         """
-        Removes all animal piece visuals from its respective square
+        Hides all animal piece visuals from its respective square - surviving animals' pieces are reused
         """
         for animal_pawn in self.square_animal_views:
-            animal_pawn.destroy() # clears from square
+            animal_pawn.hide() # clears from square
         self.square_animal_views = []
+        self.drawn_animals_signature = None
 
     def display_square_winner(self):
         """
         Displays either a predator win symbol (X), a prey win symbol
-        (+), or tie symbol (-) in its respective square frame
+        (+), or tie symbol (-) in its respective square
         """
-        # updates and calculates size of the frame
-        self.update_idletasks()
-        frame_length = self.winfo_width()
-        line_symbol_padding = frame_length*0.2
-
         winner_int = self.square_data.winner
 
         # prey win
         if winner_int == 1:
-            self.square_winner_canvas = tk.Canvas(self, background='green', highlightthickness=0)
-            # placing lines for the symbol
-            self.square_winner_canvas.create_line(line_symbol_padding, frame_length/2,
-                                        frame_length-line_symbol_padding, frame_length/2, fill='#003300',
-                                        width=10)
-            self.square_winner_canvas.create_line(frame_length/2, line_symbol_padding, frame_length/2,
-                                        frame_length-line_symbol_padding, fill='#003300',
-                                        width=10)
+            background_color, line_color, num_lines = 'green', '#003300', 2
         # predators win
         elif winner_int == -1:
-            self.square_winner_canvas = tk.Canvas(self, background='red', highlightthickness=0)
-            # placing lines for the symbol
-            self.square_winner_canvas.create_line(line_symbol_padding, frame_length-line_symbol_padding,
-                                            frame_length-line_symbol_padding, line_symbol_padding, fill='#800000',
-                                            width=10)
-            self.square_winner_canvas.create_line(line_symbol_padding, line_symbol_padding,
-                                            frame_length-line_symbol_padding, frame_length-line_symbol_padding, fill='#800000',
-                                            width=10)
+            background_color, line_color, num_lines = 'red', '#800000', 2
         # tie
         else:
-            self.square_winner_canvas = tk.Canvas(self, background='gray', highlightthickness=0)
-            # placing line for symbol
-            self.square_winner_canvas.create_line(line_symbol_padding, frame_length/2,
-                                   frame_length-line_symbol_padding, frame_length/2, fill='gray22',
-                                   width=10)
-        
-        # placing the symbol
-        self.square_winner_canvas.place(relwidth=1, relheight=1)
+            background_color, line_color, num_lines = 'gray', 'gray22', 1
 
+        self.erase_square_winner()
+        # drawing the symbol over the inside of the tile - positioned by layout_square_winner()
+        background_id = self.parent.create_rectangle(0, 0, 0, 0, fill=background_color, width=0, tags='symbol')
+        line_ids = tuple(self.parent.create_line(0, 0, 0, 0, fill=line_color, width=10, tags='symbol')
+                         for _ in range(num_lines))
+        self.square_winner_symbol_ids = (background_id, *line_ids)
+        self.displayed_winner = winner_int
+        self.layout_square_winner()
 
-class PredatorView(tk.Frame):
+    def layout_square_winner(self):
+        """
+        Positions the square winner symbol if it's displayed
+        """
+        if not self.square_winner_symbol_ids:
+            return
+        x0, y0, x1, y1 = self.inner_bounds()
+        padding_x, padding_y = (x1-x0)*0.2, (y1-y0)*0.2
+        center_x, center_y = (x0+x1)/2, (y0+y1)/2
+        background_id, *line_ids = self.square_winner_symbol_ids
+
+        self.parent.coords(background_id, x0, y0, x1, y1)
+        # prey win
+        if self.displayed_winner == 1:
+            self.parent.coords(line_ids[0], x0+padding_x, center_y, x1-padding_x, center_y)
+            self.parent.coords(line_ids[1], center_x, y0+padding_y, center_x, y1-padding_y)
+        # predators win
+        elif self.displayed_winner == -1:
+            self.parent.coords(line_ids[0], x0+padding_x, y1-padding_y, x1-padding_x, y0+padding_y)
+            self.parent.coords(line_ids[1], x0+padding_x, y0+padding_y, x1-padding_x, y1-padding_y)
+        # tie
+        else:
+            self.parent.coords(line_ids[0], x0+padding_x, center_y, x1-padding_x, center_y)
+
+    def erase_square_winner(self):
+        """
+        Removes the square winner symbol if it's displayed
+        """
+        if self.square_winner_symbol_ids:
+            self.parent.delete(*self.square_winner_symbol_ids)
+            self.square_winner_symbol_ids = ()
+
+
+class PawnView(ABC):
     """
-    Square representation for a predator game piece
+    Template for a game piece drawn on the board's canvas
+    A piece is kept for its animal between redraws - it's hidden when erased and shown again when redrawn
     """
 
     parent: SquareView
+    data: 'PredatorModel | PreyModel'
     relative_placement: tuple[float, float]
+    item_ids: tuple[int, ...] # canvas items of the piece - empty until it's first drawn
 
-    def __init__(self, parent: 'SquareView', relative_placement: tuple[float, float], data: PredatorModel, outline_color: str):
+    def __init__(self, parent: 'SquareView', relative_placement: tuple[float, float], data: 'PredatorModel | PreyModel'):
         """
         relative_placement (tuple[float, float]):
-            - (0) the relative x value within the square frame to place the piece (0-1)
-            - (1) the relative y value within the square frame to place the piece (0-1)
+            - (0) the relative x value within the square to place the piece (0-1)
+            - (1) the relative y value within the square to place the piece (0-1)
         """
-        # pulling settings
         self.parent = parent
+        self.data = data
         self.level = data.skill_level
         self.birth_round = data.birth_round
         self.relative_placement = relative_placement
-        hunger_level = data.rounds_until_starvation
-        if hunger_level == 1:
-            self.hunger_color = parent.parent.parent.settings.one_round_until_starvation_color
-        elif hunger_level == 2:
-            self.hunger_color = parent.parent.parent.settings.two_rounds_until_starvation_color
-        else:
-            self.hunger_color = parent.parent.parent.settings.three_or_more_rounds_until_starvation_color
-        
-        board_length = self.parent.parent.parent.settings.board_length
-        if board_length < 3:
-            border_thickness = 4
-        elif board_length < 6:
-            border_thickness = 3
-        else:
-            border_thickness = 2
+        self.item_ids = ()
+        # tag shared by all of the piece's canvas items
+        self.tag = f'pawn_{id(self)}'
 
-        # depending on settings (board dimensions), choose a certain border width
-        super().__init__(parent, bd=0, relief='solid', background=self.hunger_color,
-                         highlightbackground=outline_color, highlightthickness=border_thickness)
+    def move_to(self, parent: 'SquareView', relative_placement: tuple[float, float]):
+        """
+        Moves the piece to a new placement, possibly in another square - takes effect when it's next drawn
+        """
+        self.parent = parent
+        self.relative_placement = relative_placement
 
     def draw_piece(self):
-        # depending on board_length, choosing certain font sizes and birth round label padding
-        board_length = self.parent.parent.parent.settings.board_length
-
-        if board_length > 4:
-            level_label_font_size = 40//board_length
-            birth_label_font_size = 30//board_length
-
+        """
+        Draws the piece - its canvas items are only created the first time it's drawn
+        """
+        if self.item_ids:
+            self.update_items()
+            self.parent.parent.itemconfigure(self.tag, state='normal')
         else:
-            level_label_font_size = 55//board_length
-            birth_label_font_size = 38//board_length
+            self.item_ids = self.create_items()
+        self.layout()
 
-        level_label_padx = (0, 37//board_length)
-        level_label_pady = (0, 20//board_length)
+    def hide(self):
+        """
+        Hides the piece so it may be drawn again later
+        """
+        if self.item_ids:
+            self.parent.parent.itemconfigure(self.tag, state='hidden')
 
-        birth_label_padx = (30//board_length, 0)
-        birth_label_pady = (20//board_length, 0)
+    def destroy(self):
+        """
+        Removes the piece from the board
+        """
+        if self.item_ids:
+            self.parent.parent.delete(self.tag)
+            self.item_ids = ()
 
-        self.level_label = ttk.Label(self, font=('Arial', level_label_font_size, 'bold'),
-                                     text=self.level, background=self.hunger_color, anchor='center')
-        self.birth_label = ttk.Label(self, font=('Arial', birth_label_font_size, 'bold'),
-                                     text=self.birth_round, background=self.hunger_color)
-        # placing labels
-        self.rowconfigure(0, weight=1)
-        self.columnconfigure(0, weight=1)
+    @abstractmethod
+    def create_items(self) -> tuple[int, ...]:
+        """
+        Creates and returns the piece's canvas items - positioned by layout()
+        """
+        pass
 
-        self.level_label.grid(row=0, column=0, sticky='se', padx=level_label_padx, pady=level_label_pady)
-        self.birth_label.grid(row=0, column=0, sticky='nw', padx=birth_label_padx, pady=birth_label_pady)
+    def update_items(self):
+        """
+        Updates the piece's existing canvas items for any changes to its animal
+        """
 
-        # placing frame and coloring it in
-        self.place(relx=self.relative_placement[0], rely=self.relative_placement[1], relwidth=0.25, relheight=0.25)
+    @abstractmethod
+    def layout(self):
+        """
+        Positions the piece within its square if it's drawn
+        """
+        pass
 
 
-class PreyView(tk.Canvas):
+class PredatorView(PawnView):
     """
-    Circle representation for a prey game piece
+    Square representation for a predator game piece - drawn on the board's canvas
     """
 
-    parent: SquareView
-    relative_placement: tuple[float, float]
+    data: PredatorModel
 
-    def __init__(self, parent: 'SquareView', relative_placement: tuple[float, float], data: PreyModel,
-                 frame_background_color: str, circle_background_color: str, outline_color: str):
-        """
-        relative_placement (tuple[float, float]):
-            - (0) the relative x value within the square frame to place the piece (0-1)
-            - (1) the relative y value within the square frame to place the piece (0-1)
-        """
-        # attributing canvas in parent tile frame
-        super().__init__(parent, background=frame_background_color,
-                         highlightbackground=outline_color, highlightthickness=0)
-        self.parent = parent
-        self.level = data.skill_level
-        self.birth_round = data.birth_round
-        self.circle_background_color = circle_background_color
+    def __init__(self, parent: 'SquareView', relative_placement: tuple[float, float], data: PredatorModel, outline_color: str):
+        super().__init__(parent, relative_placement, data)
         self.outline_color = outline_color
-        self.relative_placement = relative_placement
+        # depending on settings (board dimensions), choose a certain border width, font sizes, and label padding
+        (self.border_thickness, self.level_label_font_size, self.birth_label_font_size,
+         self.level_label_padding, self.birth_label_padding) = predator_pawn_sizes(parent.parent.parent.settings.board_length)
 
-    def draw_piece(self):
+    def find_hunger_color(self) -> str:
         """
-        Draws the prey game piece
-        Outline is a circle
-        Inside the middle of the circle is a level label
-        On the top left edge of the circle is a birth label
+        Returns the color of the piece for its animal's rounds until starvation
         """
-        # must place frame before drawing pieces for winfo_width/height to work
-        self.place(relx=self.relative_placement[0], rely=self.relative_placement[1], relwidth=0.25, relheight=0.25)
-        # updates and calculates size of the frame
-        self.update_idletasks()
-        width, height = self.winfo_width()-3, self.winfo_height()-3
-        x0, y0 = 3, 3  # top left coordinates of bounding rectangle
-        x1, y1 = width, height  # bottom right coordinates of bounding rectangle
-
-        board_length = self.parent.parent.parent.settings.board_length
-        if board_length < 3:
-            border_thickness = 4
-        elif board_length < 6:
-            border_thickness = 3
+        settings = self.parent.parent.parent.settings
+        hunger_level = self.data.rounds_until_starvation
+        if hunger_level == 1:
+            return settings.one_round_until_starvation_color
+        elif hunger_level == 2:
+            return settings.two_rounds_until_starvation_color
         else:
-            border_thickness = 2
-
-        # depending on settings (board dimensions), choose a certain border width
-        self.create_oval(x0, y0, x1, y1, fill=self.circle_background_color, outline=self.outline_color, width=border_thickness)
-        # depending on board_length, choosing certain font sizes and birth round label padding
-        board_length = self.parent.parent.parent.settings.board_length
-
-        if board_length > 4:
-            level_label_font_size = 40//board_length
-            birth_label_font_size = 30//board_length
+            return settings.three_or_more_rounds_until_starvation_color
 
-            level_label_padx = (0, 55//board_length)
-            level_label_pady = (0, 40//board_length)
+    def create_items(self) -> tuple[int, ...]:
+        """
+        Draws the predator game piece
+        Outline is a square filled with the predator's hunger color
+        On the bottom right of the square is a level label
+        On the top left of the square is a birth label
+        """
+        board = self.parent.parent
+        tags = ('pawn', self.tag)
+        return (
+            board.create_rectangle(0, 0, 0, 0, fill=self.find_hunger_color(), outline=self.outline_color,
+                                   width=self.border_thickness, tags=tags),
+            board.create_text(0, 0, text=self.level, font=bold_arial_font(self.level_label_font_size), anchor='se', tags=tags),
+            board.create_text(0, 0, text=self.birth_round, font=bold_arial_font(self.birth_label_font_size), anchor='nw', tags=tags)
+        )
 
-            birth_label_padx = (57//board_length, 0)
-            birth_label_pady = (51//board_length, 0)
-        else:
-            level_label_font_size = 55//board_length
-            birth_label_font_size = 38//board_length
+    def update_items(self):
+        """
+        Recolors the piece - its predator may be closer to starving since it was last drawn
+        """
+        self.parent.parent.itemconfigure(self.item_ids[0], fill=self.find_hunger_color())
 
-            level_label_padx = (0, 58//board_length)
-            level_label_pady = (0, 38//board_length)
+    def layout(self):
+        if not self.item_ids:
+            return
+        x0, y0, x1, y1 = self.parent.pawn_bounds(self.relative_placement)
+        outline_id, level_id, birth_id = self.item_ids
+        border = self.border_thickness
+        board = self.parent.parent
+        # the rectangle's outline is centered on its coordinates - keeping it inside of the piece
+        board.coords(outline_id, x0 + border/2, y0 + border/2, x1 - border/2, y1 - border/2)
+        board.coords(level_id, x1 - border - self.level_label_padding[0], y1 - border - self.level_label_padding[1])
+        board.coords(birth_id, x0 + border + self.birth_label_padding[0], y0 + border + self.birth_label_padding[1])
 
-            birth_label_padx = (58//board_length, 0)
-            birth_label_pady = (48//board_length, 0)
 
-        self.level_label = ttk.Label(self, text=self.level, font=('Arial', level_label_font_size, 'bold'),
-                                     background=self.circle_background_color)
-        self.birth_label = ttk.Label(self, text=self.birth_round, font=('Arial', birth_label_font_size, 'bold'),
-                                     background=self.circle_background_color)
-        # placing labels
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
+class PreyView(PawnView):
+    """
+    Circle representation for a prey game piece - drawn on the board's canvas
+    """
 
-        self.level_label.grid(row=0, column=0, sticky='se', padx=level_label_padx, pady=level_label_pady)
-        self.birth_label.grid(row=0, column=0, sticky='nw', padx=birth_label_padx, pady=birth_label_pady)
+    data: PreyModel
 
+    def __init__(self, parent: 'SquareView', relative_placement: tuple[float, float], data: PreyModel,
+                 circle_background_color: str, outline_color: str):
+        super().__init__(parent, relative_placement, data)
+        self.circle_background_color = circle_background_color
+        self.outline_color = outline_color
+        # depending on settings (board dimensions), choose a certain border width, font sizes, and label padding
+        (self.border_thickness, self.level_label_font_size, self.birth_label_font_size,
+         self.level_label_padding, self.birth_label_padding) = prey_pawn_sizes(parent.parent.parent.settings.board_length)
 
-class Title(tk.Frame):
+    def create_items(self) -> tuple[int, ...]:
+        """
+        Draws the prey game piece
+        Outline is a circle
+        Inside the middle of the circle is a level label
+        On the top left edge of the circle is a birth label
+        """
+        board = self.parent.parent
+        tags = ('pawn', self.tag)
+        return (
+            board.create_oval(0, 0, 0, 0, fill=self.circle_background_color, outline=self.outline_color,
+                              width=self.border_thickness, tags=tags),
+            board.create_text(0, 0, text=self.level, font=bold_arial_font(self.level_label_font_size), anchor='se', tags=tags),
+            board.create_text(0, 0, text=self.birth_round, font=bold_arial_font(self.birth_label_font_size), anchor='nw', tags=tags)
+        )
+
+    def layout(self):
+        if not self.item_ids:
+            return
+        x0, y0, x1, y1 = self.parent.pawn_bounds(self.relative_placement)
+        circle_id, level_id, birth_id = self.item_ids
+        board = self.parent.parent
+        # circle is inset from the piece's bounds by 3 pixels
+        board.coords(circle_id, x0 + 3, y0 + 3, x1 - 3, y1 - 3)
+        board.coords(level_id, x1 - self.level_label_padding[0], y1 - self.level_label_padding[1])
+        board.coords(birth_id, x0 + self.birth_label_padding[0], y0 + self.birth_label_padding[1])
+
+
+class Title(ttk.Frame):
     """
     Holds the Game's title
     """
@@ -796,7 +1244,7 @@ class Title(tk.Frame):
         # setting parent frame for settings retrieval
         self.parent = parent
         # assigning frame inside of its parent frame and setting border
-        super().__init__(parent, bd=3, relief='solid', bg=self.parent.settings.title_background_color)
+        super().__init__(parent, borderwidth=3, relief='solid', style='Title.TFrame')
         
         # creating and placing widgets
         self.create_widgets()
@@ -810,42 +1258,23 @@ class Title(tk.Frame):
         Creates the widgets to go inside the title
         """
 
-        self.title_header = ttk.Label(self, text='Evolving Battles: Predators vs. Prey',
-                                      font=(self.parent.settings.title_font, 45, 'bold'), 
-                                      background=self.parent.settings.title_background_color,
-                                      foreground=self.parent.settings.title_font_color)
+        self.title_header = ttk.Label(self, text='Evolving Battles: Predators vs. Prey', style='Title.Header.TLabel')
         
         # adding credits/hyperlinks to title row corners
-        self.program_credit = ttk.Label(self, text='Program by Luke Mileski',
-                                        font=(self.parent.settings.title_font, 12, 'bold'),
-                                        background=self.parent.settings.title_background_color)
+        self.program_credit = ttk.Label(self, text='Program by Luke Mileski', style='Title.TLabel')
         
-        self.game_idea_credit = ttk.Label(self, text="Lab Game Idea by\nIUP's Dr. Gendron",
-                                        font=(self.parent.settings.title_font, 12, 'bold'),
-                                        background=self.parent.settings.title_background_color)
+        self.game_idea_credit = ttk.Label(self, text="Lab Game Idea by\nIUP's Dr. Gendron", style='Title.TLabel')
         
-        self.link_to_github = ttk.Label(self, text="View my Github",
-                                        font=(self.parent.settings.title_font, 12, 'bold'),
-                                        background=self.parent.settings.title_background_color,
-                                        cursor='hand2', foreground='dodgerblue3')
-        self.link_to_github.bind("<Button-1>", lambda e: webbrowser.open( # making link label an actual link
-            'https://github.com/lmileski/natural_selection_board_game'))
+        self.link_to_github = ttk.Label(self, text="View my Github", style='Title.Link.TLabel', cursor='hand2')
+        self.link_to_github.bind("<Button-1>", partial(open_link, GITHUB_URL)) # making link label an actual link
         
         # adding link to online game details document
-        self.link_to_game_details = ttk.Label(self, text='View Lab Game Details',
-                                        font=(self.parent.settings.title_font, 12, 'bold'),
-                                        background=self.parent.settings.title_background_color,
-                                        cursor='hand2', foreground='dodgerblue3')
-        self.link_to_game_details.bind("<Button-1>", lambda e: webbrowser.open(
-            'https://d.docs.live.net/3d8c06f048f6c577/Natural%20Selection%20Lab%20Automation.docx'))
+        self.link_to_game_details = ttk.Label(self, text='View Lab Game Details', style='Title.Link.TLabel', cursor='hand2')
+        self.link_to_game_details.bind("<Button-1>", partial(open_link, GAME_DETAILS_URL))
         
         # adding link to review form
-        self.link_to_review_form = ttk.Label(self, text='Review This Program',
-                                        font=(self.parent.settings.title_font, 12, 'bold'),
-                                        background=self.parent.settings.title_background_color,
-                                        cursor='hand2', foreground='dodgerblue3')
-        self.link_to_review_form.bind("<Button-1>", lambda e: webbrowser.open(
-            'https://docs.google.com/forms/d/e/1FAIpQLSduCBih2TzSOCG_rc5sQ_SZZrGLK6um6K9d3Sa8OO_rdWQ7LQ/viewform?usp=sf_link'))
+        self.link_to_review_form = ttk.Label(self, text='Review This Program', style='Title.Link.TLabel', cursor='hand2')
+        self.link_to_review_form.bind("<Button-1>", partial(open_link, REVIEW_FORM_URL))
 
     def set_widgets(self):
         """
@@ -862,43 +1291,87 @@ class Title(tk.Frame):
         self.link_to_review_form.place(relx=0.897, rely=0.67)
 
 
-class LeftMenu(tk.Frame):
+class LeftMenu(ttk.Frame):
     """
     Holds the configurations and game controls frame
     """
 
     parent: View
+    board_size_advisory_label: ttk.Label | None # created the first time the user chooses a 1x1 board size
 
     def __init__(self, parent: View):
         # setting parent frame for settings retrieval
         self.parent = parent
         # assigning the menu frame to the window and setting a border
-        super().__init__(parent, bd=2, relief='solid', bg=self.parent.settings.left_menu_background_color)
-        # setting up widget styles
-        widget_background_color = self.parent.settings.widget_background_color
-        widget_style = ttk.Style()
-        widget_style.configure('TButton', background=widget_background_color, font=('Arial', 14, 'bold'))
-        widget_style.configure('TScale', background=widget_background_color)
-        widget_style.configure('TCombobox', fieldbackground=widget_background_color, font=('Arial', 12, 'bold'))
-        highlighted_button_style = ttk.Style()
-        highlighted_button_style.configure('highlighted_button.TButton', background='DarkGoldenrod3', font=('Arial', 14, 'bold'))
+        super().__init__(parent, borderwidth=2, relief='solid', style='LeftMenu.TFrame')
         # creating child frames - pack from top to bottom upon construction
         self.game_controls = GameControls(self)
         self.configurations = Configurations(self)
 
-        # creating an advisory label the default starting animals when user chooses a 1x1 board size
-        self.board_size_advisory_label = ttk.Label(self, text="Default starting animal pop. exceeds a 1x1 board's pop. capacity",
-                                                   font=("Arial", 11), foreground='darkorange3',
-                                                   background= self.parent.settings.left_menu_background_color)
-        self.board_size_advisory_label.pack(pady=3)
-        self.board_size_advisory_label_pack_info = self.board_size_advisory_label.pack_info()
-        self.board_size_advisory_label.pack_forget()
+        # advisory label for the default starting animals when user chooses a 1x1 board size - only created once needed
+        self.board_size_advisory_label = None
 
         # placing the menu within the window
         self.place(relx=0, rely=0.1, relwidth=0.3, relheight=0.9)
 
+    def show_board_size_advisory_label(self):
+        """
+        Displays the advisory label below the configurations frame - creating it the first time it's shown
+        """
+        if self.board_size_advisory_label is None:
+            self.board_size_advisory_label = ttk.Label(self, text="Default starting animal pop. exceeds a 1x1 board's pop. capacity",
+                                                       style='LeftMenu.Advisory.TLabel')
+        self.board_size_advisory_label.pack(pady=3)
+
+    def hide_board_size_advisory_label(self):
+        """
+        Removes the advisory label if it has been displayed
+        """
+        if self.board_size_advisory_label is not None:
+            self.board_size_advisory_label.pack_forget()
+
 
-class GameControls(tk.Frame):
+class ToggleFrame(ttk.Frame):
+    """
+    Frame holding widgets that are shown and hidden throughout the game
+    Each of those widget's grid placement is remembered so it can be shown again in the same spot
+    """
+
+    grid_args: dict[tk.Misc, dict] # widget -> keyword arguments of its grid placement
+
+    def __init__(self, parent: tk.Misc, **frame_options):
+        self.grid_args = {}
+        super().__init__(parent, **frame_options)
+
+    def grid_toggled(self, widget: tk.Misc, shown: bool = False, **grid_args):
+        """
+        Remembers the grid placement of a widget that's shown and hidden - only placing it if it starts out shown
+
+        Parameters:
+            - widget (tk.Misc): the widget inside of this frame
+            - shown (bool): True if the widget is initially displayed, False otherwise
+            - grid_args: the keyword arguments of the widget's grid placement
+        """
+        self.grid_args[widget] = grid_args
+        if shown:
+            widget.grid(**grid_args)
+
+    def show_widgets(self, *widgets: tk.Misc):
+        """
+        Places widgets back in their remembered grid placement
+        """
+        for widget in widgets:
+            widget.grid(**self.grid_args[widget])
+
+    def hide_widgets(self, *widgets: tk.Misc):
+        """
+        Removes widgets from the grid - their placement is still remembered
+        """
+        for widget in widgets:
+            widget.grid_forget()
+
+
+class GameControls(ToggleFrame):
     """
     Holds the buttons managing the execution of the game (restart game, start round, pause, autofinish game)
     Additionally, holds the button for exporting the last completed game's data to excel
@@ -909,9 +1382,8 @@ class GameControls(tk.Frame):
     def __init__(self, parent: LeftMenu):
         # setting parent frame for settings retrieval
         self.parent = parent
-        self.background_color = self.parent.parent.settings.game_controls_background_color
         # assigning frame to its parent frame and setting its border
-        super().__init__(parent, bd=2.5, relief='solid', bg=self.background_color)
+        super().__init__(parent, borderwidth=2.5, relief='solid', style='GameControls.TFrame')
         # filling the frame with widgets
         self.create_widgets()
         self.place_widgets()
@@ -922,7 +1394,7 @@ class GameControls(tk.Frame):
         """
         Creates the widgets for the inside of this frame
         """
-        self.title = ttk.Label(self, text='Game Controls', background=self.background_color, font=("Arial", 39, 'underline'))
+        self.title = ttk.Label(self, text='Game Controls', style='GameControls.Title.TLabel')
         # creating game control buttons
         self.start_game_button = ttk.Button(self, text=' Start\nGame', style='highlighted_button.TButton')
         self.reset_game_button = ttk.Button(self, text='Reset\nGame')
@@ -930,14 +1402,14 @@ class GameControls(tk.Frame):
         self.start_round_button = ttk.Button(self, text='  Start\nRound', style='highlighted_button.TButton')
         self.finish_round_button = ttk.Button(self, text='Finish\nRound', style='highlighted_button.TButton')
         self.export_data_button = ttk.Button(self, text='Export\nResults', style='highlighted_button.TButton')
-        # placeholder label for preventing game controls frame from rescaling when hiding buttons
-        self.placeholder_label = ttk.Label(self, text='', background=self.background_color)
         # creating a scale to the user assign a certain number of rounds for the game
-        self.number_of_rounds_scale_label = ttk.Label(self, text='Number of Rounds:', background=self.background_color, font=("Arial", 16, 'bold'))
+        self.number_of_rounds_scale_label = ttk.Label(self, text='Number of Rounds:', style='GameControls.Header.TLabel')
         self.number_of_rounds_scale = ttk.Scale(self, from_=1, to=99, length=150)
         num_rounds = self.parent.parent.settings.num_rounds
         self.number_of_rounds_scale.set(num_rounds) # set at default
-        self.number_of_rounds_scale_marker = ttk.Label(self, text=num_rounds, background=self.background_color, font=("Arial", 16, 'bold'))
+        # marker text is written through a StringVar so scale drags don't reconfigure the label
+        self.number_of_rounds_value = tk.StringVar(self, value=str(num_rounds))
+        self.number_of_rounds_scale_marker = ttk.Label(self, textvariable=self.number_of_rounds_value, style='GameControls.Header.TLabel')
     
     def place_widgets(self):
         """
@@ -948,39 +1420,71 @@ class GameControls(tk.Frame):
         self.columnconfigure((0, 1, 2), weight=1)
 
         self.title.grid(row=0, sticky='ns', columnspan=3)
-        # placing game control buttons
-        self.start_game_button.grid(row=1, column=0, columnspan=3, padx=80, pady=15, sticky='w')
-        self.reset_game_button.grid(row=1, column=0, columnspan=3, padx=80, pady=15, sticky='w')
+        # placing game control buttons - only the start game button is initially displayed
+        # the other buttons' placements are remembered to show/hide them when user starts/ends game
+        self.grid_toggled(self.start_game_button, shown=True, row=1, column=0, columnspan=3, padx=80, pady=15, sticky='w')
+        self.grid_toggled(self.reset_game_button, row=1, column=0, columnspan=3, padx=80, pady=15, sticky='w')
 
-        self.export_data_button.grid(row=1, column=0, columnspan=3, padx=80, pady=15, sticky='e')
+        self.grid_toggled(self.export_data_button, row=1, column=0, columnspan=3, padx=80, pady=15, sticky='e')
 
-        self.autofinish_game_button.grid(row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='w')
+        self.grid_toggled(self.autofinish_game_button, row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='w')
 
-        self.start_round_button.grid(row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='e')
-        self.finish_round_button.grid(row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='e')
-        # placeholder label
-        self.placeholder_label.grid(row=2, column=1, padx=10, pady=(5, 40))
+        self.grid_toggled(self.start_round_button, row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='e')
+        self.grid_toggled(self.finish_round_button, row=2, column=0, columnspan=3, padx=80, pady=(0, 10), sticky='e')
+        # keeping the height of the second row while its buttons are hidden - prevents the frame from rescaling
+        # the row keeps the height of the empty label that used to hold it - a line of the default font plus 45 pixels of padding
+        self.rowconfigure(2, minsize=tkfont.nametofont('TkDefaultFont').metrics('linespace') + 45)
         # placing number of rounds scale
         self.number_of_rounds_scale_label.grid(row=3, column=0, sticky='w', columnspan=3, padx=(27, 0), pady=10)
         self.number_of_rounds_scale.grid(row=3, column=2, sticky='e', padx=(0, 25))
         self.number_of_rounds_scale_marker.grid(row=3, column=0, columnspan=3, sticky='e', padx=(0, 185))
-        # remembering the grid placement of buttons to show/hide them when user starts/ends game
-        self.start_game_button_grid_info = self.start_game_button.grid_info()
-        self.reset_game_button_grid_info = self.reset_game_button.grid_info()
-        self.autofinish_game_button_grid_info = self.autofinish_game_button.grid_info()
-        self.start_round_button_grid_info = self.start_round_button.grid_info()
-        self.finish_round_button_grid_info = self.finish_round_button.grid_info()
-        self.export_data_button_grid_info = self.export_data_button.grid_info()
-        self.placeholder_label_grid_info = self.placeholder_label.grid_info()
-        # grid forgetting any buttons that won't be initially displayed
-        self.reset_game_button.grid_forget()
-        self.autofinish_game_button.grid_forget()
-        self.start_round_button.grid_forget()
-        self.finish_round_button.grid_forget()
-        self.export_data_button.grid_forget()
-
-
-class Configurations(tk.Frame):
+
+
+class ScaleMarker(tk.Canvas):
+    """
+    Displays the current value of a scale as a text item on a fixed size canvas
+    Unlike a label, changing the text never changes the widget's requested size,
+    so dragging a scale doesn't make tk recalculate the grid it's in
+    """
+
+    def __init__(self, parent: tk.Misc, text: str, background_color: str):
+        marker_font = FONTS['arial_14_bold']
+        # wide enough for any three character marker - ie '256' or '10s'
+        width = marker_font.measure('000') + 4
+        super().__init__(parent, width=width, height=marker_font.metrics('linespace'),
+                         background=background_color, highlightthickness=0)
+        # text is right aligned like the labels it replaces
+        self.text_id = self.create_text(width, 0, text=text, font=marker_font, anchor='ne')
+        # text set while the marker is hidden - displayed once the marker is shown again
+        self.pending_text = None
+        self.bind('<Map>', self.display_pending_text)
+
+    def set_text(self, text: str | int):
+        """
+        Displays new text on the marker
+        The text of a hidden marker is only changed once the marker is shown again
+
+        Parameters:
+        text: the scale's new value
+        """
+        if not self.winfo_ismapped():
+            self.pending_text = text
+            return
+        self.itemconfigure(self.text_id, text=text)
+
+    def display_pending_text(self, event: tk.Event):
+        """
+        Displays the latest text set while the marker was hidden
+
+        Parameters:
+        event: the marker's map event
+        """
+        if self.pending_text is not None:
+            self.itemconfigure(self.text_id, text=self.pending_text)
+            self.pending_text = None
+
+
+class Configurations(ToggleFrame):
     """
     Holds all tkinter labels and widgets related to the user customizations
     """
@@ -989,17 +1493,16 @@ class Configurations(tk.Frame):
     custom_board_checkbox_value: tk.IntVar
     custom_animals_checkbox_value: tk.IntVar
     automatic_round_start_checkbox_value: tk.IntVar
+    board_section: tuple[tk.Misc, ...] # widgets shown while the customize board checkbutton is checked
+    round_delay_section: tuple[tk.Misc, ...] # widgets shown while the automatic round start checkbutton is checked
+    animals_section: tuple[tk.Misc, ...] # widgets shown while the customize starting animals checkbutton is checked
 
     def __init__(self, parent: LeftMenu):
         # setting parent frame for settings retrieval
         self.parent = parent
         self.background_color = self.parent.parent.settings.customize_settings_background_color
         # assigning frame to its parent frame and setting its border
-        super().__init__(parent, bd=2.5, relief='solid', bg=self.background_color)
-        # creating style for reset button
-        reset_settings_style = ttk.Style()
-        widget_background_color = self.parent.parent.settings.widget_background_color
-        reset_settings_style.configure('reset_settings.TButton', background=widget_background_color, font=("Arial", 13, 'bold'))
+        super().__init__(parent, borderwidth=2.5, relief='solid', style='Configurations.TFrame')
         # assigning stored values for checkbuttons
         self.custom_board_checkbox_value = tk.IntVar()
         self.custom_animals_checkbox_value = tk.IntVar()
@@ -1014,89 +1517,71 @@ class Configurations(tk.Frame):
         """
         Creates the widgets for the inside of this frame
         """
+        settings = self.parent.parent.settings
+        background_color = self.background_color
 
-        self.title = ttk.Label(self, text='Customize Settings', background=self.background_color, font=("Arial", 39, 'underline'), anchor='center')
+        self.title = ttk.Label(self, text='Customize Settings', style='Configurations.Title.TLabel', anchor='center')
     
         self.restore_default_settings_button = ttk.Button(self, text=' Restore\n Default\nSettings', width=10, style='reset_settings.TButton')
         # adding labels and list boxes for the Customize Board options
-        self.custom_board_checkbutton = tk.Checkbutton(self, text='Customize Board', bg=self.background_color,
-                                                onvalue=True, offvalue=False,
-                                                font=("Arial", 18, 'bold'), activebackground=self.background_color,
-                                                variable=self.custom_board_checkbox_value)
+        self.custom_board_checkbutton = ttk.Checkbutton(self, text='Customize Board', variable=self.custom_board_checkbox_value,
+                                                onvalue=True, offvalue=False, style='Configurations.TCheckbutton')
         
-        self.custom_board_size_label = ttk.Label(self, text='Board Size: ', background=self.background_color, font=("Arial", 13))
-        self.custom_board_size_box = ttk.Combobox(self, values=[f'{i}x{i}' for i in range(1, self.parent.parent.settings.max_board_length+1)],
-                                         state='readonly', width=13)
-        board_size = self.parent.parent.settings.board_length
-        self.custom_board_size_box.set(f"{board_size}x{board_size}")
+        self.custom_board_size_label = ttk.Label(self, text='Board Size: ', style='Configurations.TLabel')
+        board_size_options = board_size_values(settings.max_board_length)
+        self.custom_board_size_box = ttk.Combobox(self, values=board_size_options, state='readonly', width=13)
+        board_size = settings.board_length
+        self.custom_board_size_box.set(board_size_options[board_size-1])
         
-        self.custom_checker_color_label = ttk.Label(self, text='Board Colors: ', background=self.background_color, font=("Arial", 13))
-        self.custom_checker_color_box = ttk.Combobox(self, values=[f'Brown x White', 'Gray x White', 'Blue x White', 'Pink x White', 'Blue x Pink'],
+        self.custom_checker_color_label = ttk.Label(self, text='Board Colors: ', style='Configurations.TLabel')
+        self.custom_checker_color_box = ttk.Combobox(self, values=CHECKER_COLOR_VALUES,
                                                 state='readonly', width=13)
-        color1 = self.parent.parent.settings.checkered_color1
-        color2 = self.parent.parent.settings.checkered_color2
-        if color1 == 'navajowhite4':
-            color1 = 'brown'
-        if color2 == 'mint cream':
-            color2 = 'white'
-        self.custom_checker_color_box.set(f"{(color1).capitalize()} x {(color2).capitalize()}")
+        self.custom_checker_color_box.set(CHECKER_DISPLAY[(settings.checkered_color1, settings.checkered_color2)])
 
         # adding labels and scales for the Customize Starting Animals options
-        self.custom_animals_checkbutton = tk.Checkbutton(self, text='Customize Starting Animals', bg=self.background_color,
-                                                onvalue=True, offvalue=False,
-                                                font=("Arial", 18, 'bold'), activebackground=self.background_color,
-                                                variable=self.custom_animals_checkbox_value)
+        self.custom_animals_checkbutton = ttk.Checkbutton(self, text='Customize Starting Animals', variable=self.custom_animals_checkbox_value,
+                                                onvalue=True, offvalue=False, style='Configurations.TCheckbutton')
         # customization of starting predators
-        self.custom_predator_label = ttk.Label(self, text='Predators:', background=self.background_color, font=("Arial", 16))
-
-        max_population = (self.parent.parent.settings.board_length ** 2) * 4 # max population is 4*number of squares
-
-        self.custom_predator_population_scale_label = ttk.Label(self, text='Population:', background=self.background_color, font=("Arial", 13))
-        self.custom_predator_population_scale = ttk.Scale(self, from_=0, to=max_population, length=150)
-        self.custom_predator_population_scale.set(16)
-        self.predator_population_scale_marker = ttk.Label(self, text='16', background=self.background_color, font=("Arial", 14, 'bold'))
-
-        self.custom_predator_level_scale_label = ttk.Label(self, text='Visual Acuity Level:', background=self.background_color, font=("Arial", 13))
-        self.custom_predator_level_scale = ttk.Scale(self, from_=0, to=10, length=150)
-        self.custom_predator_level_scale.set(5)
-        self.predator_level_scale_marker = ttk.Label(self, text='5', background=self.background_color, font=("Arial", 14, 'bold'))
-
-        self.custom_predator_starvation_scale_label = ttk.Label(self, text='Satiety Level:', background=self.background_color, font=("Arial", 13))
-        self.custom_predator_starvation_scale = ttk.Scale(self, from_=1, to=10, length=150)
-        self.custom_predator_starvation_scale.set(2)
-        self.starvation_scale_marker = ttk.Label(self, text='2', background=self.background_color, font=("Arial", 14, 'bold'))
+        self.custom_predator_label = ttk.Label(self, text='Predators:', style='Configurations.Header.TLabel')
 
         # customization of starting prey
-        self.custom_prey_label = ttk.Label(self, text='Prey:', background=self.background_color, font=("Arial", 16))
-
-        self.custom_prey_population_scale_label = ttk.Label(self, text='Population:', background=self.background_color, font=("Arial", 13))
-        self.custom_prey_population_scale = ttk.Scale(self, from_=0, to=max_population, length=150)
-        self.custom_prey_population_scale.set(16)
-        self.prey_population_scale_marker = ttk.Label(self, text='16', background=self.background_color, font=("Arial", 14, 'bold'))
-
-        self.custom_prey_level_scale_label = ttk.Label(self, text='Camoflauge Level:', background=self.background_color, font=("Arial", 13))
-        self.custom_prey_level_scale = ttk.Scale(self, from_=0, to=10, length=150)
-        self.custom_prey_level_scale.set(5)
-        self.prey_level_scale_marker = ttk.Label(self, text='5', background=self.background_color, font=("Arial", 14, 'bold'))
+        self.custom_prey_label = ttk.Label(self, text='Prey:', style='Configurations.Header.TLabel')
         
         # adding labels and scales for the Automatic Round Start options
-        self.automatic_round_start_checkbutton = tk.Checkbutton(self, text='Automatic Round Start', bg=self.background_color,
-                                                onvalue=True, offvalue=False,
-                                                font=("Arial", 18, 'bold'), activebackground=self.background_color,
-                                                variable=self.automatic_round_start_checkbox_value)
-
-        default_delay = int(self.parent.parent.settings.delay_between_rounds)
-        self.round_delay_label = ttk.Label(self, text='Delay Between Rounds:', background=self.background_color, font=("Arial", 13))
-        self.custom_round_delay_scale = ttk.Scale(self, from_=0, to=10, length=150)
-        self.custom_round_delay_scale.set(default_delay)
-        self.custom_round_delay_scale_marker = ttk.Label(self, text=f'{default_delay}s', background=self.background_color, font=("Arial", 14, 'bold'))
+        self.automatic_round_start_checkbutton = ttk.Checkbutton(self, text='Automatic Round Start', variable=self.automatic_round_start_checkbox_value,
+                                                onvalue=True, offvalue=False, style='Configurations.TCheckbutton')
+
+        max_population = settings.max_population # max population is 4*number of squares
+        default_delay = int(settings.delay_between_rounds)
+        # each scale has a label, the scale itself, and a marker displaying its value
+        # (label attribute, label text, scale attribute, scale range, starting value, marker attribute, marker text)
+        scale_specs = (
+            ('custom_predator_population_scale_label', 'Population:', 'custom_predator_population_scale',
+             (0, max_population), 16, 'predator_population_scale_marker', '16'),
+            ('custom_predator_level_scale_label', 'Visual Acuity Level:', 'custom_predator_level_scale',
+             (0, 10), 5, 'predator_level_scale_marker', '5'),
+            ('custom_predator_starvation_scale_label', 'Satiety Level:', 'custom_predator_starvation_scale',
+             (1, 10), 2, 'starvation_scale_marker', '2'),
+            ('custom_prey_population_scale_label', 'Population:', 'custom_prey_population_scale',
+             (0, max_population), 16, 'prey_population_scale_marker', '16'),
+            ('custom_prey_level_scale_label', 'Camoflauge Level:', 'custom_prey_level_scale',
+             (0, 10), 5, 'prey_level_scale_marker', '5'),
+            ('round_delay_label', 'Delay Between Rounds:', 'custom_round_delay_scale',
+             (0, 10), default_delay, 'custom_round_delay_scale_marker', f'{default_delay}s')
+        )
+        for label_name, label_text, scale_name, (lowest, highest), starting_value, marker_name, marker_text in scale_specs:
+            setattr(self, label_name, ttk.Label(self, text=label_text, style='Configurations.TLabel'))
+            scale = ttk.Scale(self, from_=lowest, to=highest, length=150)
+            scale.set(starting_value)
+            setattr(self, scale_name, scale)
+            setattr(self, marker_name, ScaleMarker(self, marker_text, background_color))
     
     def place_widgets(self):
         """
         Places the widgets inside of this frame
         """
-        # configuring grid layout
-        self.rowconfigure((0, 1, 2, 3, 4, 5, 6, 7, 8, 9 ,10, 11, 12, 13), weight=1)
+        # configuring grid layout - only the columns get weight since the frame is packed without expand,
+        # so its height always matches the rows' requested height and row weights would never be used
         self.columnconfigure((0, 1, 2), weight=1)
 
         self.title.grid(row=0, columnspan=3)
@@ -1106,130 +1591,101 @@ class Configurations(tk.Frame):
 
         self.restore_default_settings_button.grid(row=1, column=2, sticky='ne', padx=(0, 25), pady=(15, 0), rowspan=4)
 
-        self.custom_board_size_label.grid(row=2, column=0, sticky='w', padx=55, columnspan=2)
-        self.custom_board_size_label_grid_info = self.custom_board_size_label.grid_info()
-        self.custom_board_size_label.grid_forget()
-
-        self.custom_board_size_box.grid(row=2, column=0, sticky='w', padx=(150, 0), pady=5, columnspan=3)
-        self.custom_board_size_box_grid_info = self.custom_board_size_box.grid_info()
-        self.custom_board_size_box.grid_forget()
-
-        self.custom_checker_color_label.grid(row=3, column=0, sticky='w', padx=40, columnspan=2)
-        self.custom_checker_color_label_grid_info = self.custom_checker_color_label.grid_info()
-        self.custom_checker_color_label.grid_forget()
-
-        self.custom_checker_color_box.grid(row=3, column=0, sticky='w', padx=(150, 0), pady=5, columnspan=3)
-        self.custom_checker_color_box_grid_info = self.custom_checker_color_box.grid_info()
-        self.custom_checker_color_box.grid_forget()
+        # widgets of each section are only shown while their section's checkbutton is checked
+        self.grid_toggled(self.custom_board_size_label, row=2, column=0, sticky='w', padx=55, columnspan=2)
+        self.grid_toggled(self.custom_board_size_box, row=2, column=0, sticky='w', padx=(150, 0), pady=5, columnspan=3)
+        self.grid_toggled(self.custom_checker_color_label, row=3, column=0, sticky='w', padx=40, columnspan=2)
+        self.grid_toggled(self.custom_checker_color_box, row=3, column=0, sticky='w', padx=(150, 0), pady=5, columnspan=3)
+        self.board_section = (self.custom_board_size_label, self.custom_board_size_box,
+                              self.custom_checker_color_label, self.custom_checker_color_box)
 
         # placing labels and scales for the custom round delay options
         self.automatic_round_start_checkbutton.grid(row=4, sticky='w', padx=5, pady=5, columnspan=3)
-        self.round_delay_label.grid(row=5, column=0, sticky='w', padx=45, columnspan=3)
-        self.round_delay_label_grid_info = self.round_delay_label.grid_info()
-        self.round_delay_label.grid_forget()
-
-        self.custom_round_delay_scale.grid(row=5, column=1, sticky='e', padx=25, pady=10, columnspan=3)
-        self.custom_round_delay_scale_grid_info = self.custom_round_delay_scale.grid_info()
-        self.custom_round_delay_scale.grid_forget()
-
-        self.custom_round_delay_scale_marker.grid(row=5, column=0, sticky='e', columnspan=3, padx=(0, 185))
-        self.custom_round_delay_scale_marker_grid_info = self.custom_round_delay_scale_marker.grid_info()
-        self.custom_round_delay_scale_marker.grid_forget()
+        self.grid_toggled(self.round_delay_label, row=5, column=0, sticky='w', padx=45, columnspan=3)
+        self.grid_toggled(self.custom_round_delay_scale, row=5, pady=10, **SCALE_GRID)
+        self.grid_toggled(self.custom_round_delay_scale_marker, row=5, **SCALE_MARKER_GRID)
+        self.round_delay_section = (self.round_delay_label, self.custom_round_delay_scale,
+                                    self.custom_round_delay_scale_marker)
 
         # placing labels and scales for Customize Starting Animals options
         self.custom_animals_checkbutton.grid(row=6, column=0, sticky='w', padx=5, pady=(5, 10), columnspan=3)
         # placing labels and scales for the custom starting predator options
-        self.custom_predator_label.grid(row=7, column=0, sticky='w', padx=30, columnspan=3)
-        self.custom_predator_label_grid_info = self.custom_predator_label.grid_info()
-        self.custom_predator_label.grid_forget()
-
-        self.custom_predator_population_scale_label.grid(row=8, column=0, sticky='e', padx=34, columnspan=2)
-        self.custom_predator_population_scale_label_grid_info = self.custom_predator_population_scale_label.grid_info()
-        self.custom_predator_population_scale_label.grid_forget()
-
-        self.custom_predator_population_scale.grid(row=8, column=1, sticky='e', padx=25, pady=5, columnspan=3)
-        self.custom_predator_population_scale_grid_info = self.custom_predator_population_scale.grid_info()
-        self.custom_predator_population_scale.grid_forget()
-
-        self.predator_population_scale_marker.grid(row=8, column=0, sticky='e', columnspan=3, padx=(0, 185))
-        self.predator_population_scale_marker_grid_info = self.predator_population_scale_marker.grid_info()
-        self.predator_population_scale_marker.grid_forget()
-
-
-        self.custom_predator_level_scale_label.grid(row=9, column=0, sticky='e', padx=34, columnspan=2)
-        self.custom_predator_level_scale_label_grid_info = self.custom_predator_level_scale_label.grid_info()
-        self.custom_predator_level_scale_label.grid_forget()
-
-        self.custom_predator_level_scale.grid(row=9, column=1, sticky='e', padx=25, pady=5, columnspan=3)
-        self.custom_predator_level_scale_grid_info = self.custom_predator_level_scale.grid_info()
-        self.custom_predator_level_scale.grid_forget()
-
-        self.predator_level_scale_marker.grid(row=9, column=0, sticky='e', columnspan=3, padx=(0, 185))
-        self.predator_level_scale_marker_grid_info = self.predator_level_scale_marker.grid_info()
-        self.predator_level_scale_marker.grid_forget()
-
-        self.custom_predator_starvation_scale_label.grid(row=10, column=0, sticky='e', padx=34, columnspan=2)
-        self.custom_predator_starvation_scale_label_grid_info = self.custom_predator_starvation_scale_label.grid_info()
-        self.custom_predator_starvation_scale_label.grid_forget()
-
-        self.custom_predator_starvation_scale.grid(row=10, column=1, sticky='e', padx=25, pady=5, columnspan=3)
-        self.custom_predator_starvation_scale_grid_info = self.custom_predator_starvation_scale.grid_info()
-        self.custom_predator_starvation_scale.grid_forget()
-
-        self.starvation_scale_marker.grid(row=10, column=0, sticky='e', columnspan=3, padx=(0, 185))
-        self.starvation_scale_marker_grid_info = self.starvation_scale_marker.grid_info()
-        self.starvation_scale_marker.grid_forget()
-
-        self.custom_prey_label.grid(row=11, column=0, sticky='w', padx=30, pady=(10, 0))
-        self.custom_prey_label_grid_info = self.custom_prey_label.grid_info()
-        self.custom_prey_label.grid_forget()
-
-        self.custom_prey_population_scale_label.grid(row=12, column=0, sticky='e', padx=34, columnspan=2)
-        self.custom_prey_population_scale_label_grid_info = self.custom_prey_population_scale_label.grid_info()
-        self.custom_prey_population_scale_label.grid_forget()
-
-        self.custom_prey_population_scale.grid(row=12, column=1, sticky='e', padx=25, pady=5, columnspan=3)
-        self.custom_prey_population_scale_grid_info = self.custom_prey_population_scale.grid_info()
-        self.custom_prey_population_scale.grid_forget()
-
-        self.prey_population_scale_marker.grid(row=12, column=0, sticky='e', columnspan=3, padx=(0, 185))
-        self.prey_population_scale_marker_grid_info = self.prey_population_scale_marker.grid_info()
-        self.prey_population_scale_marker.grid_forget()
-
-        self.custom_prey_level_scale_label.grid(row=13, column=0, sticky='e', padx=34, pady=(5, 15), columnspan=2)
-        self.custom_prey_level_scale_label_grid_info = self.custom_prey_level_scale_label.grid_info()
-        self.custom_prey_level_scale_label.grid_forget()
-
-        self.custom_prey_level_scale.grid(row=13, column=1, sticky='e', padx=25, pady=(5, 15), columnspan=3)
-        self.custom_prey_level_scale_grid_info = self.custom_prey_level_scale.grid_info()
-        self.custom_prey_level_scale.grid_forget()
-
-        self.prey_level_scale_marker.grid(row=13, column=0, sticky='e', columnspan=3, padx=(0, 185), pady=(5, 15))
-        self.prey_level_scale_marker_grid_info = self.prey_level_scale_marker.grid_info()
-        self.prey_level_scale_marker.grid_forget()
-
-
-class RightMenu(tk.Frame):
+        self.grid_toggled(self.custom_predator_label, row=7, column=0, sticky='w', padx=30, columnspan=3)
+
+        self.grid_toggled(self.custom_predator_population_scale_label, row=8, **SCALE_LABEL_GRID)
+        self.grid_toggled(self.custom_predator_population_scale, row=8, pady=5, **SCALE_GRID)
+        self.grid_toggled(self.predator_population_scale_marker, row=8, **SCALE_MARKER_GRID)
+
+        self.grid_toggled(self.custom_predator_level_scale_label, row=9, **SCALE_LABEL_GRID)
+        self.grid_toggled(self.custom_predator_level_scale, row=9, pady=5, **SCALE_GRID)
+        self.grid_toggled(self.predator_level_scale_marker, row=9, **SCALE_MARKER_GRID)
+
+        self.grid_toggled(self.custom_predator_starvation_scale_label, row=10, **SCALE_LABEL_GRID)
+        self.grid_toggled(self.custom_predator_starvation_scale, row=10, pady=5, **SCALE_GRID)
+        self.grid_toggled(self.starvation_scale_marker, row=10, **SCALE_MARKER_GRID)
+        # placing labels and scales for the custom starting prey options
+        self.grid_toggled(self.custom_prey_label, row=11, column=0, sticky='w', padx=30, pady=(10, 0))
+
+        self.grid_toggled(self.custom_prey_population_scale_label, row=12, **SCALE_LABEL_GRID)
+        self.grid_toggled(self.custom_prey_population_scale, row=12, pady=5, **SCALE_GRID)
+        self.grid_toggled(self.prey_population_scale_marker, row=12, **SCALE_MARKER_GRID)
+
+        self.grid_toggled(self.custom_prey_level_scale_label, row=13, pady=(5, 15), **SCALE_LABEL_GRID)
+        self.grid_toggled(self.custom_prey_level_scale, row=13, pady=(5, 15), **SCALE_GRID)
+        self.grid_toggled(self.prey_level_scale_marker, row=13, pady=(5, 15), **SCALE_MARKER_GRID)
+        self.animals_section = (self.custom_predator_label,
+                                self.custom_predator_population_scale_label, self.custom_predator_population_scale,
+                                self.predator_population_scale_marker,
+                                self.custom_predator_level_scale_label, self.custom_predator_level_scale,
+                                self.predator_level_scale_marker,
+                                self.custom_predator_starvation_scale_label, self.custom_predator_starvation_scale,
+                                self.starvation_scale_marker,
+                                self.custom_prey_label,
+                                self.custom_prey_population_scale_label, self.custom_prey_population_scale,
+                                self.prey_population_scale_marker,
+                                self.custom_prey_level_scale_label, self.custom_prey_level_scale,
+                                self.prey_level_scale_marker)
+
+
+class RightMenu(ttk.Frame):
     """
     Holds the scoreboard and board key to the right of the gameboard
     """
 
     parent: View
+    scoreboard: 'ScoreBoard | None'
+    boardkey: 'BoardKey | None'
 
     def __init__(self, parent: View):
         # setting parent frame for settings retrieval
         self.parent = parent
-        self.background_color = self.parent.settings.right_menu_background_color
         # assigning the rightmenu frame to be within the window and setting border
-        super().__init__(parent, bd=2.5, relief='solid', background=self.background_color)
-        # creating child frames - packed upon construction
-        self.scoreboard = ScoreBoard(self)
-        self.boardkey = BoardKey(self)
+        super().__init__(parent, borderwidth=2.5, relief='solid', style='RightMenu.TFrame')
+        # child frames are created once the window is idle so the rest of the window is shown sooner
+        self.scoreboard = None
+        self.boardkey = None
+        self.after_idle(self.build_children)
         # placing the rightmenu frame within the window
         self.place(relx=0.86, rely=0.1, relwidth=0.14, relheight=0.9)
 
+    def build_children(self):
+        """
+        Creates the child frames - packed upon construction
+        Only creates them the first time it's called
+        """
+        if self.scoreboard is None:
+            self.scoreboard = ScoreBoard(self)
+            self.boardkey = BoardKey(self)
+
+    def get_scoreboard(self) -> 'ScoreBoard':
+        """
+        Returns the scoreboard - creating the child frames first if the window hasn't been idle yet
+        """
+        self.build_children()
+        return self.scoreboard
+
 
-class ScoreBoard(tk.Frame):
+class ScoreBoard(ttk.Frame):
     """
     Holds the scoreboard for the game which includes for each animal:
         - their population
@@ -1241,88 +1697,121 @@ class ScoreBoard(tk.Frame):
     total_populations: tuple[int, int]
     average_levels: tuple[float, float]
     average_hunger_level: float
+    update_pending: bool # whether round results were skipped while the window was minimized
+    uncolor_pending: bool # whether the skipped results' colors were reset before they could be displayed
 
     def __init__(self, parent: RightMenu):
         # setting parent frame for settings retrieval
         self.parent = parent
         self.background_color = self.parent.parent.settings.scoreboard_background_color
         # assigning the scoreboard frame to be within the rightmenu and setting border
-        super().__init__(parent, bd=2.5, relief='solid', background=self.background_color)
+        super().__init__(parent, borderwidth=2.5, relief='solid', style='ScoreBoard.TFrame')
 
         # creating and placing widgets within the scoreboard
         self.create_widgets()
         self.place_widgets()
         # placing the scoreboard in the rightmenu from the top down
         self.pack(padx=10, pady=10, fill='both')
+        # round results aren't displayed while the window is minimized - the latest results
+        # are displayed once the window is shown again
+        self.update_pending = False
+        self.uncolor_pending = False
+        self.parent.parent.bind('<Map>', self.display_pending_update, add='+')
     
     def create_widgets(self):
         """
         Creates the widgets for the inside of this frame
         """
-
-        self.round_label = ttk.Label(self, text='Round 0', font=("Arial", 32, "underline"),
-                                     background=self.background_color, anchor='center')
-
-        self.predator_stats_label = ttk.Label(self, text='Predator Stats:', font=("Arial", 16, "bold"),
-                                              background=self.background_color)
-        
-        self.predator_population_label = ttk.Label(self, text='Population:', font=("Arial", 14),
-                                                   background=self.background_color)
-        self.predator_population_marker = ttk.Label(self, text='16', font=("Arial", 16, "bold"),
-                                                    background=self.background_color)
-
-        self.predator_level_label = ttk.Label(self, text='Avg. Level:', font=("Arial", 14),
-                                              background=self.background_color)
-        self.predator_level_marker = ttk.Label(self, text='5', font=("Arial", 16, "bold"),
-                                               background=self.background_color)
-
-        self.predator_starvation_label = ttk.Label(self, text="Avg. Satiety:", font=("Arial", 14),
-                                                   background=self.background_color)
-        self.predator_starvation_marker = ttk.Label(self, text='2', font=("Arial", 16, "bold"),
-                                                    background=self.background_color)
-
-
-        self.prey_stats_label = ttk.Label(self, text='Prey Stats:', font=("Arial", 15, "bold"),
-                                              background=self.background_color)
-        
-        self.prey_population_label = ttk.Label(self, text='Population:', font=("Arial", 14),
-                                                   background=self.background_color)
-        self.prey_population_marker = ttk.Label(self, text='16', font=("Arial", 16, "bold"),
-                                                    background=self.background_color)
-
-        self.prey_level_label = ttk.Label(self, text='Avg. Level:', font=("Arial", 14),
-                                              background=self.background_color)
-        self.prey_level_marker = ttk.Label(self, text='5', font=("Arial", 16, "bold"),
-                                               background=self.background_color)
+        background_color = self.background_color
+
+        # the round and all stats are text items on one canvas - changing an item's text only
+        # redraws the canvas instead of making tk re-measure a label and recalculate the grid
+        self.stats_canvas = tk.Canvas(self, background=background_color, highlightthickness=0, height=327)
+        # the canvas' width - centered and right aligned items are moved as it changes
+        self.canvas_width = 0
+
+        self.round_text_id = self.stats_canvas.create_text(0, 35, text='Round 0', font=FONTS['arial_32_underline'],
+                                                           anchor='center', tags='centered')
+
+        self.stats_canvas.create_text(12, 86, text='Predator Stats:', font=FONTS['arial_16_bold'], anchor='w')
+        self.stats_canvas.create_text(45, 121, text='Population:', font=FONTS['arial_14'], anchor='w')
+        self.stats_canvas.create_text(45, 156, text='Avg. Level:', font=FONTS['arial_14'], anchor='w')
+        self.stats_canvas.create_text(34, 191, text='Avg. Satiety:', font=FONTS['arial_14'], anchor='w')
+
+        self.stats_canvas.create_text(12, 239, text='Prey Stats:', font=FONTS['arial_15_bold'], anchor='w')
+        self.stats_canvas.create_text(45, 274, text='Population:', font=FONTS['arial_14'], anchor='w')
+        self.stats_canvas.create_text(45, 309, text='Avg. Level:', font=FONTS['arial_14'], anchor='w')
+
+        # the text items of the changing stats - right aligned 12 pixels from the canvas' edge
+        self.text_ids = {}
+        # the displayed value of each stat - kept so the previous round's values don't have to be read back from tk
+        self.marker_values = {}
+        # the text color of each stat
+        self.marker_colors = {}
+        for marker, value, y in (('predator_population', 16, 121), ('predator_level', 5, 156),
+                                 ('predator_starvation', 2, 191), ('prey_population', 16, 274),
+                                 ('prey_level', 5, 309)):
+            self.text_ids[marker] = self.stats_canvas.create_text(self.canvas_width-12, y, text=value,
+                                                                  font=FONTS['arial_16_bold'], anchor='e', tags='marker')
+            self.marker_values[marker] = value
+            self.marker_colors[marker] = 'black'
+        # whether the stats are still colored by the last round's results
+        self.stats_colored = False
+
+        # keeping the round centered and the markers right aligned as the canvas is resized
+        self.stats_canvas.bind('<Configure>', self.align_text)
         
     def place_widgets(self):
         """
         Places the widgets inside of this frame
         """
-        # setting the grid
-        self.columnconfigure((0, 1), weight=1)
-        self.rowconfigure((0, 1, 2, 3, 4, 5, 6, 7), weight=1)
-        # setting widgets
-        self.round_label.grid(column=0, row=0, columnspan=2, padx=5, pady=10)
+        self.stats_canvas.pack(fill='x', pady=(0, 5))
 
-        self.predator_stats_label.grid(column=0, row=1, padx=12, pady=5, sticky='w', columnspan=2)
-
-        self.predator_population_label.grid(column=0, row=2, padx=45, pady=5, sticky='w', columnspan=3)
-        self.predator_population_marker.grid(column=1, row=2, padx=12, pady=5, sticky='e')
+    def align_text(self, event: tk.Event):
+        """
+        Moves the round to stay centered and the stat markers to stay right aligned
+        with the width of the stats canvas
 
-        self.predator_level_label.grid(column=0, row=3, padx=45, pady=5, sticky='w', columnspan=3)
-        self.predator_level_marker.grid(column=1, row=3, padx=12, pady=5, sticky='e')
+        Parameters:
+        event: the canvas' configure event
+        """
+        width_change = event.width - self.canvas_width
+        self.stats_canvas.move('marker', width_change, 0)
+        self.stats_canvas.move('centered', width_change/2, 0)
+        self.canvas_width = event.width
 
-        self.predator_starvation_label.grid(column=0, row=4, padx=34, pady=5, sticky='w', columnspan=3)
-        self.predator_starvation_marker.grid(column=1, row=4, padx=12, pady=5, sticky='e')
+    def set_round(self, round_num: int):
+        """
+        Displays the current round
 
-        self.prey_stats_label.grid(column=0, row=5, padx=12, pady=(18, 5), sticky='w', columnspan=2)
+        Parameters:
+        round_num: the round to display
+        """
+        self.stats_canvas.itemconfigure(self.round_text_id, text=f'Round {round_num}')
 
-        self.prey_population_label.grid(column=0, row=6, padx=45, pady=5, sticky='w', columnspan=3)
-        self.prey_population_marker.grid(column=1, row=6, padx=12, pady=5, sticky='e')
+    def set_marker(self, marker: str, value: int | float, color: str | None = None):
+        """
+        Displays a new value for one of the scoreboard's stats
 
-        self.prey_level_label.grid(column=0, row=7, padx=45, pady=5, sticky='w', columnspan=3)
-        self.prey_level_marker.grid(column=1, row=7, padx=12, pady=5, sticky='e')
+        Parameters:
+        marker: the stat to display - 'predator_population', 'predator_level', 'predator_starvation',
+            'prey_population' or 'prey_level'
+        value: the stat's new value
+        color: the stat's new text color - the current color is kept by default
+
+        Nothing is redrawn if the stat already displays the same value and color
+        """
+        previous_value = self.marker_values[marker]
+        # an int and a float of equal value are displayed differently ('5' and '5.0')
+        value_unchanged = value == previous_value and type(value) is type(previous_value)
+        if color is None or color == self.marker_colors[marker]:
+            if value_unchanged:
+                return
+            self.stats_canvas.itemconfigure(self.text_ids[marker], text=value)
+        else:
+            self.stats_canvas.itemconfigure(self.text_ids[marker], text=value, fill=color)
+            self.marker_colors[marker] = color
+        self.marker_values[marker] = value
 
     def update_scoreboard(self):
         """
@@ -1331,68 +1820,70 @@ class ScoreBoard(tk.Frame):
         If the score increased in comparison to the start of the round, the text is green
         If the score decreased in comparison to the start of the round, the text is red
         """
-
-        # finding correct colors in response to previous score
-        previous_predator_population = int(self.predator_population_marker.cget('text'))
-        previous_prey_population = int(self.prey_population_marker.cget('text'))
-        previous_predator_avg_level = float(self.predator_level_marker.cget('text'))
-        previous_prey_avg_level = float(self.prey_level_marker.cget('text'))
-        previous_avg_hunger_level = float(self.predator_starvation_marker.cget('text'))
-        # finding new scores
-        current_predator_population = int(self.total_populations[0])
-        current_prey_population = int(self.total_populations[1])
-        current_predator_avg_level = float(self.average_levels[0])
-        current_prey_avg_level = float(self.average_levels[1])
-        current_avg_hunger_level = float(self.average_hunger_level)
-        
-        # updating the labels with new scores and appropriate colors
+        if not self.winfo_viewable():
+            self.update_pending = True
+            return
+        marker_values = self.marker_values
+        # updating the markers with new scores and appropriate colors
         # green means a higher score, red means a lower score, gray means no change
-        color = "green" if current_predator_population > previous_predator_population \
-            else "red" if current_predator_population < previous_predator_population else "gray27"
-        self.predator_population_marker.configure(text=current_predator_population, foreground=color)
-
-        color = "green" if current_prey_population > previous_prey_population \
-            else "red" if current_prey_population < previous_prey_population else "gray27"
-        self.prey_population_marker.configure(text=current_prey_population, foreground=color)
-
-        color = "green" if current_predator_avg_level > previous_predator_avg_level \
-            else "red" if current_predator_avg_level < previous_predator_avg_level else "gray27"
-        self.predator_level_marker.configure(text=current_predator_avg_level, foreground=color)
+        for marker, current_value in scoreboard_stats(self.total_populations, self.average_levels,
+                                                      self.average_hunger_level):
+            self.set_marker(marker, current_value, score_change_color(current_value, marker_values[marker]))
+        self.stats_colored = True
 
-        color = "green" if current_prey_avg_level > previous_prey_avg_level \
-            else "red" if current_prey_avg_level < previous_prey_avg_level else "gray27"
-        self.prey_level_marker.configure(text=current_prey_avg_level, foreground=color)
+    def display_pending_update(self, event: tk.Event):
+        """
+        Updates the scoreboard with the round results it skipped while the window was minimized
+        The results are displayed uncolored if the round's colors were already reset
 
-        color = "green" if current_avg_hunger_level > previous_avg_hunger_level \
-            else "red" if current_avg_hunger_level < previous_avg_hunger_level else "gray27"
-        self.predator_starvation_marker.configure(text=current_avg_hunger_level, foreground=color)
+        Parameters:
+        event: a map event within the window
+        """
+        # the root's binding is shared by every widget in the window - only the window itself being shown matters
+        if event.widget is not self.parent.parent:
+            return
+        if self.update_pending and self.winfo_viewable():
+            self.update_pending = False
+            self.update_scoreboard()
+            if self.uncolor_pending:
+                self.uncolor_pending = False
+                self.uncolor_scoreboard_text()
 
     def uncolor_scoreboard_text(self):
         """
         Uncolors the scoreboard text color changes from the results of the round
-        """
-        self.predator_population_marker.configure(foreground='black')
-        self.prey_population_marker.configure(foreground='black')
-        self.predator_level_marker.configure(foreground='black')
-        self.prey_level_marker.configure(foreground='black')
-        self.predator_starvation_marker.configure(foreground='black')
+        Nothing is done if the stats haven't been colored since they were last uncolored
+        """
+        # the round's results haven't been displayed yet - they're uncolored once they are
+        if self.update_pending:
+            self.uncolor_pending = True
+            return
+        if not self.stats_colored:
+            return
+        # every stat shares the 'marker' tag
+        self.stats_canvas.itemconfigure('marker', fill='black')
+        self.marker_colors = dict.fromkeys(self.marker_colors, 'black')
+        self.stats_colored = False
 
     def reset_scoreboard_text(self):
         """
         Resets the scoreboard value when the 'reset game' button is clicked
         """
         settings = self.parent.parent.settings
+        # results skipped while the window was minimized are from the reset game
+        self.update_pending = False
+        self.uncolor_pending = False
 
-        self.round_label.configure(text='Round 0')
+        self.set_round(0)
 
-        self.predator_population_marker.configure(text=settings.num_initial_predators)
-        self.prey_population_marker.configure(text=settings.num_initial_prey)
-        self.predator_level_marker.configure(text=settings.predator_starting_level)
-        self.prey_level_marker.configure(text=settings.prey_starting_level)
-        self.predator_starvation_marker.configure(text=settings.rounds_until_starvation)
+        self.set_marker('predator_population', settings.num_initial_predators)
+        self.set_marker('prey_population', settings.num_initial_prey)
+        self.set_marker('predator_level', settings.predator_starting_level)
+        self.set_marker('prey_level', settings.prey_starting_level)
+        self.set_marker('predator_starvation', settings.rounds_until_starvation)
 
 
-class BoardKey(tk.Frame):
+class BoardKey(ttk.Frame):
     """
     Holds the gameboard key for the predator and prey pieces
     """
@@ -1404,7 +1895,7 @@ class BoardKey(tk.Frame):
         self.parent = parent
         self.background_color = self.parent.parent.settings.boardkey_background_color
         # assigning the board key frame to be within the right menu and setting border
-        super().__init__(parent, bd=3, relief='solid', background=self.background_color)
+        super().__init__(parent, borderwidth=3, relief='solid', style='BoardKey.TFrame')
 
         # creating and placing widgets within the boardkey frame
         self.create_widgets()
@@ -1415,145 +1906,124 @@ class BoardKey(tk.Frame):
     def create_widgets(self):
         """
         Creates the widgets for the inside of this frame
-        """       
-        two_rounds_until_starvation_color = self.parent.parent.settings.two_rounds_until_starvation_color
-        predator_outline = self.parent.parent.settings.predator_outline_color
-        prey_color = self.parent.parent.settings.prey_background_color
-        prey_outline = self.parent.parent.settings.prey_outline_color
-
-        self.boardkey_label = ttk.Label(self, text='Board Key', font=("Arial", 29, "underline"),
-                                     background=self.background_color, anchor='center')
-        
-        # creating predator pawn visual
-        self.predator_pawn_label = ttk.Label(self, text='Predator Pawn:', font=("Arial", 16, "bold"),
-                                             background=self.background_color)
-        
-        self.predator_pawn_object = tk.Frame(self, bd=0, relief='solid', background=two_rounds_until_starvation_color,
-                                             highlightbackground=predator_outline, highlightthickness=3,
-                                             width=60, height=60)
+
+        The whole key is drawn on one canvas - each part of the key is drawn around the
+        canvas' origin with its own tag and is then moved to its place by place_widgets()
+        """
+        settings = self.parent.parent.settings
+        two_rounds_until_starvation_color = settings.two_rounds_until_starvation_color
+        predator_outline = settings.predator_outline_color
+        prey_color = settings.prey_background_color
+        prey_outline = settings.prey_outline_color
+
+        self.key_canvas = tk.Canvas(self, background=self.background_color, highlightthickness=0)
+        key_canvas = self.key_canvas
+        # the key's section labels and descriptions each share a font and anchor - every part starts at the origin
+        section_label = partial(key_canvas.create_text, 0, 0, font=FONTS['arial_16_bold'], anchor='w')
+        pawn_description = partial(key_canvas.create_text, 0, 0, font=FONTS['arial_8_bold'], anchor='nw')
+        symbol_description = partial(key_canvas.create_text, 0, 0, font=FONTS['arial_12_bold'], anchor='nw')
+
+        key_canvas.create_text(0, 0, text='Board Key', font=FONTS['arial_29_underline'], anchor='n', tags='title')
         
-        self.predator_level_label = ttk.Label(self.predator_pawn_object, font=('Arial', 15, 'bold'),
-                                     text='6', background=two_rounds_until_starvation_color, anchor='center')
-        self.predator_birth_label = ttk.Label(self.predator_pawn_object, font=('Arial', 11, 'bold'),
-                                     text='1', background=two_rounds_until_starvation_color)
+        # creating predator pawn visual - a 60x60 square with a 3 pixel border
+        section_label(text='Predator Pawn:', tags='predator_pawn_label')
+        key_canvas.create_rectangle(1.5, -28.5, 58.5, 28.5, fill=two_rounds_until_starvation_color,
+                                    outline=predator_outline, width=3, tags='predator_pawn')
+        key_canvas.create_text(11, -22, text='1', font=FONTS['arial_11_bold'], anchor='nw', tags='predator_pawn')
+        key_canvas.create_text(33, -5, text='6', font=FONTS['arial_15_bold'], anchor='nw', tags='predator_pawn')
         
         # adding description for predator visual
-        self.predator_level_description = ttk.Label(self, text='6: Visual Acuity Level', font=("Arial", 8, 'bold'),
-                                                    background=self.background_color)
-        self.predator_birth_round_description = ttk.Label(self, text='1: Birth Round', font=("Arial", 8, 'bold'),
-                                                          background=self.background_color)
-        self.all_predator_colors_description = ttk.Label(self, text='Satiety Level (rounds until starvation):\n\n    Red = 1,  Orange = 2,  Yellow = 3+',
-                                                    font=("Arial", 7, 'bold'), background=self.background_color)
+        pawn_description(text='1: Birth Round', tags='predator_birth_round_description')
+        pawn_description(text='6: Visual Acuity Level', anchor='w', tags='predator_level_description')
+        key_canvas.create_text(0, 0, text='Satiety Level (rounds until starvation):\n\n    Red = 1,  Orange = 2,  Yellow = 3+',
+                               font=FONTS['arial_7_bold'], anchor='nw', tags='all_predator_colors_description')
         
-        # creating prey pawn visual
-        self.prey_pawn_label = ttk.Label(self, text='Prey Pawn:', font=("Arial", 16, "bold"),
-                                             background=self.background_color)
-        
-        self.prey_pawn_object = tk.Canvas(self, background=self.background_color,
-                                          width=65, height=65, highlightthickness=0)
-
-        # must place prey object ahead of time to find the frame length
-        self.prey_pawn_object.place(relx=0.03, rely=0.53, anchor='w')
-        # updates and calculates size of the frame
-        self.prey_pawn_object.update_idletasks()
-        width, height = self.prey_pawn_object.winfo_width()-3, self.prey_pawn_object.winfo_height()-3
-        x0, y0 = 3, 3  # top left coordinates of bounding rectangle
-        x1, y1 = width, height  # bottom right coordinates of bounding rectangle
-        self.prey_pawn_object.create_oval(x0, y0, x1, y1, fill=prey_color, outline=prey_outline, width=3)
-
-        self.prey_level_label = ttk.Label(self.prey_pawn_object, font=('Arial', 15, 'bold'),
-                                          text='4', background=prey_color, anchor='center')
-        self.prey_birth_label = ttk.Label(self.prey_pawn_object, font=('Arial', 11, 'bold'),
-                                          text='2', background=prey_color)
+        # creating prey pawn visual - a circle within a 65x65 square
+        section_label(text='Prey Pawn:', tags='prey_pawn_label')
+        key_canvas.create_oval(3, -29.5, 62, 29.5, fill=prey_color, outline=prey_outline, width=3, tags='prey_pawn')
+        key_canvas.create_text(16, -21, text='2', font=FONTS['arial_11_bold'], anchor='nw', tags='prey_pawn')
+        key_canvas.create_text(32, -6, text='4', font=FONTS['arial_15_bold'], anchor='nw', tags='prey_pawn')
         
         # adding description for prey visual
-        self.prey_level_description = ttk.Label(self, text='4: Camoflauge Level', font=("Arial", 8, 'bold'),
-                                                background=self.background_color)
-        self.prey_birth_round_description = ttk.Label(self, text='2: Birth Round', font=("Arial", 8, 'bold'),
-                                                      background=self.background_color)
-        self.prey_color_description = ttk.Label(self, text='(color has no significance)',
-                                                font=("Arial", 8, 'bold'), background=self.background_color)
+        pawn_description(text='2: Birth Round', tags='prey_birth_round_description')
+        pawn_description(text='4: Camoflauge Level', tags='prey_level_description')
+        pawn_description(text='(color has no significance)', tags='prey_color_description')
 
         # adding a section for square result symbols
-        self.result_symbols_label = ttk.Label(self, text='Result Symbols:', font=("Arial", 16, "bold"),
-                                             background=self.background_color)
+        section_label(text='Result Symbols:', tags='result_symbols_label')
         
+        # all symbol keys are 40x40 squares with lines padded from their edges
+        symbol_length = 40
+        line_symbol_padding = symbol_length*0.2
         # predators win symbol
-        self.predator_win_canvas = tk.Canvas(self, background='red', highlightthickness=0, width=40, height=40)
+        key_canvas.create_rectangle(0, 0, symbol_length, symbol_length, fill='red', width=0, tags='predator_win_symbol')
+        key_canvas.create_line(line_symbol_padding, symbol_length-line_symbol_padding,
+                               symbol_length-line_symbol_padding, line_symbol_padding, fill='#800000',
+                               width=5, tags='predator_win_symbol')
+        key_canvas.create_line(line_symbol_padding, line_symbol_padding,
+                               symbol_length-line_symbol_padding, symbol_length-line_symbol_padding, fill='#800000',
+                               width=5, tags='predator_win_symbol')
         # prey win symbol
-        self.prey_win_canvas = tk.Canvas(self, background='green', highlightthickness=0, width=40, height=40)
+        key_canvas.create_rectangle(0, 0, symbol_length, symbol_length, fill='green', width=0, tags='prey_win_symbol')
+        key_canvas.create_line(line_symbol_padding, symbol_length/2,
+                               symbol_length-line_symbol_padding, symbol_length/2, fill='#003300',
+                               width=5, tags='prey_win_symbol')
+        key_canvas.create_line(symbol_length/2, line_symbol_padding, symbol_length/2,
+                               symbol_length-line_symbol_padding, fill='#003300',
+                               width=5, tags='prey_win_symbol')
         # tie symbol
-        self.tie_canvas = tk.Canvas(self, background='gray', highlightthickness=0, width=40, height=40)
-        # placing canvases ahead of time to be able to calculate their length
-        self.predator_win_canvas.place(relx=0.07, rely=0.71)
-        self.prey_win_canvas.place(relx=0.07, rely=0.795)
-        self.tie_canvas.place(relx=0.07, rely=0.88)
-        # updates and calculates size of the frame - all symbol keys have the same height and width
-        self.predator_win_canvas.update_idletasks()
-        frame_length = self.predator_win_canvas.winfo_width()
-        line_symbol_padding = frame_length*0.2
-
-        # placing lines for the symbols
-        self.predator_win_canvas.create_line(line_symbol_padding, frame_length-line_symbol_padding,
-                                        frame_length-line_symbol_padding, line_symbol_padding, fill='#800000',
-                                        width=5)
-        self.predator_win_canvas.create_line(line_symbol_padding, line_symbol_padding,
-                                        frame_length-line_symbol_padding, frame_length-line_symbol_padding, fill='#800000',
-                                        width=5)
-        
-        self.prey_win_canvas.create_line(line_symbol_padding, frame_length/2,
-                                    frame_length-line_symbol_padding, frame_length/2, fill='#003300',
-                                    width=5)
-        self.prey_win_canvas.create_line(frame_length/2, line_symbol_padding, frame_length/2,
-                                    frame_length-line_symbol_padding, fill='#003300',
-                                    width=5)
-        
-        self.tie_canvas.create_line(line_symbol_padding, frame_length/2,
-                                frame_length-line_symbol_padding, frame_length/2, fill='gray22',
-                                width=5)
+        key_canvas.create_rectangle(0, 0, symbol_length, symbol_length, fill='gray', width=0, tags='tie_symbol')
+        key_canvas.create_line(line_symbol_padding, symbol_length/2,
+                               symbol_length-line_symbol_padding, symbol_length/2, fill='gray22',
+                               width=5, tags='tie_symbol')
         
         # adding descriptions for the symbols
-        self.predator_win_canvas_description = ttk.Label(self, text=':  Predators Win', font=("Arial", 12, 'bold'),
-                                                         background=self.background_color)
-        self.prey_win_canvas_description = ttk.Label(self, text=':  Prey Win', font=("Arial", 12, 'bold'),
-                                                     background=self.background_color)
-        self.tie_canvas_description = ttk.Label(self, text=': Tie', font=("Arial", 12, 'bold'),
-                                                background=self.background_color)
-        self.winner_description = ttk.Label(self, text='square winner is determined by the trophic\n    team with the highest net pop. growth',
-                                            font=('Arial', 7, 'bold'), background=self.background_color)
+        symbol_description(text=':  Predators Win', tags='predator_win_description')
+        symbol_description(text=':  Prey Win', tags='prey_win_description')
+        symbol_description(text=': Tie', tags='tie_description')
+        key_canvas.create_text(0, 0, text='square winner is determined by the trophic\n    team with the highest net pop. growth',
+                               font=FONTS['arial_7_bold'], anchor='nw', tags='winner_description')
         
     def place_widgets(self):
         """
         Places the widgets inside of this frame
         """
-        # setting widgets
-        self.boardkey_label.place(relx=0.5, rely=0.02, anchor='n')
-
-        self.predator_pawn_label.place(relx=0.05, rely=0.15, anchor='w')
-        self.predator_pawn_object.place(relx=0.05, rely=0.25, anchor='w')
-        # predator level/birth labels inside predator object
-        self.predator_birth_label.place(relx=0.15, rely=0.1)
-        self.predator_level_label.place(relx=0.55, rely=0.4)
-        # adding descriptions
-        self.predator_birth_round_description.place(relx=0.38, rely=0.21)
-        self.predator_level_description.place(relx=0.38, rely=0.27, anchor='w')
-        self.all_predator_colors_description.place(relx=0.05, rely=0.32)
-
-        self.prey_pawn_label.place(relx=0.05, rely=0.43, anchor='w')
-        # prey pawn is placed ahead of time for winfo_height/width() to work
-        # prey level/birth labels inside prey object
-        self.prey_birth_label.place(relx=0.25, rely=0.18)
-        self.prey_level_label.place(relx=0.5, rely=0.4)
-        # adding descriptions
-        self.prey_birth_round_description.place(relx=0.38, rely=0.49)
-        self.prey_level_description.place(relx=0.38, rely=0.53)
-        self.prey_color_description.place(relx=0.13, rely=0.6)
-        
-        self.result_symbols_label.place(relx=0.05, rely=0.67, anchor='w')
-        # canvases placed ahead of time for frame lengths to be calculated
-
-        # placing winner symbol descriptions
-        self.predator_win_canvas_description.place(relx=0.3, rely=0.72)
-        self.prey_win_canvas_description.place(relx=0.3, rely=0.805)
-        self.tie_canvas_description.place(relx=0.3, rely=0.89)
-        self.winner_description.place(relx=0.001, rely=0.95)
\ No newline at end of file
+        # relative position of each part of the key within the canvas
+        self.key_item_positions = {
+            'title': (0.5, 0.02),
+            'predator_pawn_label': (0.05, 0.15),
+            'predator_pawn': (0.05, 0.25),
+            'predator_birth_round_description': (0.38, 0.21),
+            'predator_level_description': (0.38, 0.27),
+            'all_predator_colors_description': (0.05, 0.32),
+            'prey_pawn_label': (0.05, 0.43),
+            'prey_pawn': (0.03, 0.53),
+            'prey_birth_round_description': (0.38, 0.49),
+            'prey_level_description': (0.38, 0.53),
+            'prey_color_description': (0.13, 0.6),
+            'result_symbols_label': (0.05, 0.67),
+            'predator_win_symbol': (0.07, 0.71),
+            'prey_win_symbol': (0.07, 0.795),
+            'tie_symbol': (0.07, 0.88),
+            'predator_win_description': (0.3, 0.72),
+            'prey_win_description': (0.3, 0.805),
+            'tie_description': (0.3, 0.89),
+            'winner_description': (0.001, 0.95)
+        }
+        # every part of the key starts at the canvas' origin
+        self.key_canvas_size = (0, 0)
+        # moving the parts of the key whenever the canvas is resized
+        self.key_canvas.bind('<Configure>', self.place_key_items)
+        self.key_canvas.pack(fill='both', expand=True)
+
+    def place_key_items(self, event: tk.Event):
+        """
+        Moves each part of the key to its relative position within the resized canvas
+
+        Parameters:
+        event: the canvas' configure event
+        """
+        previous_width, previous_height = self.key_canvas_size
+        for tag, (relx, rely) in self.key_item_positions.items():
+            self.key_canvas.move(tag, relx*(event.width-previous_width), rely*(event.height-previous_height))
+        self.key_canvas_size = (event.width, event.height)